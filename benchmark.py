@@ -0,0 +1,278 @@
+"""Latency benchmark for the MathCraft compute engine.
+
+Runs every engine path (compute plus figure build) with representative
+inputs, outside Streamlit, and reports latency percentiles per path::
+
+    python benchmark.py
+    python benchmark.py --repeat 50 --filter riemann
+
+``--startup`` instead measures the cold-start import of ``app.py`` with
+``python -X importtime`` and exits non-zero when it is over budget, pulls
+in a module that should load lazily, or the installed Streamlit breaks the
+pending-rerun check that cancels symbolic calls::
+
+    python benchmark.py --startup --startup-budget 1000
+
+``--reruns`` times a full script rerun of every section through Streamlit's
+``AppTest``, once with the manipulative expanders closed (only the selected
+section runs) and once with all of them open (everything runs, as every
+rerun did when ``app.py`` was one monolithic script).
+"""
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from mathcraft import engine, figures
+from mathcraft.expressions import expression_cache
+from mathcraft.figure_cache import cached_figure, figure_cache
+from mathcraft.store import symbolic_store
+from mathcraft.workers import symbolic_pool
+
+
+def _limits():
+    curve = engine.limits_curve((3, 0, 0), (1, 0, -1), 20)
+    return figures.limits_figure(curve, True)
+
+
+def _asymptote_example():
+    example = "(3x² + 2x)/(x² - 1)"
+    return figures.example_figure(engine.example_curve(example), example, 2, 2)
+
+
+def _oblique_example():
+    example = "(x³ + 2x)/(x - 1)"
+    return figures.oblique_figure(engine.oblique_example(example), example)
+
+
+def _function_builder():
+    args = ([1.0, 1.0, 1.0], [2, 1, 0], [1.0, 1.0], [1, 0])
+    analysis = engine.builder_analysis(*args)
+    return figures.builder_figure(engine.builder_curve(*args), analysis["asymptote"])
+
+
+def _function_builder_20_terms():
+    args = ([1.0] * 20, list(range(19, -1, -1)), [2.0] * 20, list(range(19, -1, -1)))
+    analysis = engine.builder_analysis(*args)
+    return figures.builder_figure(engine.builder_curve(*args), analysis["asymptote"])
+
+
+def _ftc_part1():
+    return figures.ftc_part1_figure(engine.ftc_part1("sin(t)"), "sin(t)")
+
+
+def _ftc_part1_custom():
+    result = engine.ftc_part1("exp(-t**2)", 1.0, -3.0, 3.0)
+    return figures.ftc_part1_figure(result, "exp(-t**2)")
+
+
+def _ftc_part2():
+    return figures.ftc_part2_figure(engine.ftc_part2("x³ - 2x", 0.0, 3.0), "x³ - 2x", 0.0, 3.0)
+
+
+def _mvt():
+    result = engine.mvt_analysis("x³ - 3x", -1.0, 2.0)
+    return figures.mvt_figure(result, -1.0, 2.0, True, True)
+
+
+def _ftc_part1_cached():
+    return cached_figure(("ftc_part1", "sin(t)", "sin(t)", 0.0, 0.0, 5.0, "symbolic"), _ftc_part1)
+
+
+def _mvt_cached():
+    return cached_figure(("mvt", "x³ - 3x", -1.0, 2.0, True, True), _mvt)
+
+
+def _limit_calculator():
+    return engine.calculate_limit("3*x**2/(x**2 - 1)", "∞")
+
+
+def _asymptote_finder():
+    return engine.find_asymptotes("(x**2 + 1)/(x**2 - 4)")
+
+
+def _riemann():
+    result = engine.riemann_sum("x**2", 0.0, 2.0, 100, "Midpoint")
+    return figures.riemann_figure(result, "x**2", "Midpoint", 100)
+
+
+def _riemann_100k():
+    result = engine.riemann_sum("x**2", 0.0, 2.0, 100_000, "Midpoint")
+    return figures.riemann_figure(result, "x**2", "Midpoint", 100_000)
+
+
+def _riemann_convergence():
+    study = engine.riemann_convergence("sin(x)", 0.0, 2.0)
+    return figures.riemann_convergence_figure(study, "sin(x)")
+
+
+CASES = [
+    ("interactive_limits", _limits),
+    ("asymptote_explorer", _asymptote_example),
+    ("oblique_asymptote", _oblique_example),
+    ("function_builder", _function_builder),
+    ("function_builder_20_terms", _function_builder_20_terms),
+    ("ftc_part1", _ftc_part1),
+    ("ftc_part1_custom", _ftc_part1_custom),
+    ("ftc_part2", _ftc_part2),
+    ("mvt_explorer", _mvt),
+    ("ftc_part1_cached", _ftc_part1_cached),
+    ("mvt_explorer_cached", _mvt_cached),
+    ("limit_calculator", _limit_calculator),
+    ("asymptote_finder", _asymptote_finder),
+    ("riemann_sums", _riemann),
+    ("riemann_sums_100k", _riemann_100k),
+    ("riemann_convergence", _riemann_convergence),
+]
+
+
+def time_case(func, repeat, warmup):
+    """Run ``func`` ``warmup + repeat`` times and return the timed runs in ms."""
+    for _ in range(warmup):
+        func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return np.array(timings)
+
+
+def format_row(name, timings):
+    p50, p90, p99 = np.percentile(timings, [50, 90, 99])
+    return f"{name:<28}{p50:>10.2f}{p90:>10.2f}{p99:>10.2f}{timings.max():>10.2f}"
+
+
+# Cold-start budget for `import app` (Overview page rendered), in ms
+STARTUP_BUDGET_MS = 1000
+
+# Heavy modules the Overview page must not import
+DEFERRED_MODULES = ("sympy", "scipy", "matplotlib", "pandas", "mathcraft.engine", "mathcraft.figures")
+
+
+def import_profile(module="app"):
+    """``{module: (self_us, cumulative_us)}`` from a fresh ``python -X importtime -c 'import module'``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True, check=True,
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        profile.setdefault(name.strip(), (int(self_us), int(cumulative_us)))
+    return profile
+
+
+def startup_check(budget_ms, runs=3):
+    """Print the cold-start cost of ``app.py``; 0 if within ``budget_ms`` and nothing deferred loaded."""
+    profiles = [import_profile() for _ in range(runs)]
+    total_ms = np.median([profile["app"][1] for profile in profiles]) / 1000
+    profile = profiles[-1]
+
+    print(f"import app: {total_ms:.0f} ms (median of {runs}, budget {budget_ms} ms)")
+    heaviest = sorted(((cumulative, name) for name, (_, cumulative) in profile.items()
+                       if "." not in name and name != "app"), reverse=True)[:8]
+    for cumulative, name in heaviest:
+        print(f"  {name:<26}{cumulative / 1000:>8.0f} ms")
+
+    loaded = [name for name in DEFERRED_MODULES if name in profile]
+    if loaded:
+        print(f"FAIL: loaded at startup but should be lazy: {', '.join(loaded)}")
+    if total_ms > budget_ms:
+        print(f"FAIL: startup {total_ms:.0f} ms is over the {budget_ms} ms budget")
+    # input_changed() reads private Streamlit state, so check it against the installed version
+    from sections.symbolic import rerun_detection_works
+    detects = rerun_detection_works()
+    if not detects:
+        print("FAIL: sections.symbolic cannot see pending reruns; symbolic calls won't be cancelled")
+    return 1 if loaded or total_ms > budget_ms or not detects else 0
+
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+
+def _app_test(open_expanders):
+    """An ``AppTest`` of app.py, run once, with every lazy expander open or closed."""
+    from streamlit.testing.v1 import AppTest
+
+    probe = AppTest.from_file(APP_PATH, default_timeout=60)
+    probe.run()
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    for expander in probe.expander:
+        if expander.key is not None:
+            at.session_state[expander.key] = open_expanders
+    at.run()
+    return at
+
+
+def rerun_latency(repeat, warmup):
+    """Print per-section rerun p50 with manipulatives closed vs all open."""
+    logging.disable(logging.WARNING)  # Streamlit logs bare-mode and deprecation warnings on every run
+    apps = {"closed": _app_test(False), "all open": _app_test(True)}
+    print(f"{'rerun p50 (ms)':<28}{'closed':>10}{'all open':>10}")
+    for section in apps["closed"].sidebar.selectbox[0].options:
+        row = []
+        for at in apps.values():
+            at.sidebar.selectbox[0].set_value(section)
+            timings = time_case(at.run, repeat, warmup)
+            row.append(np.percentile(timings, 50))
+        print(f"{section:<28}{row[0]:>10.1f}{row[1]:>10.1f}")
+
+
+def print_figure_cache():
+    """Figure cache hit rate overall and per kind of figure, for sizing it."""
+    stats = figure_cache.stats()
+    print(f"figure cache: {stats['size']} figures, {stats['bytes'] / 1024:.0f} KiB "
+          f"of {stats['max_bytes'] / 1024 ** 2:.0f} MiB, {stats['evictions']} evictions "
+          f"({stats['hit_rate']:.0%} hit rate)")
+    for kind, counts in sorted(stats["kinds"].items()):
+        print(f"  {kind:<24}{counts['hits']:>6} hits{counts['misses']:>6} misses ({counts['hit_rate']:.0%})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per case")
+    parser.add_argument("--warmup", type=int, default=2, help="untimed runs per case")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--startup", action="store_true", help="check app.py's cold-start import time instead")
+    parser.add_argument("--reruns", action="store_true",
+                        help="time full app reruns per section (manipulatives closed vs open) instead")
+    parser.add_argument("--startup-budget", type=float, default=STARTUP_BUDGET_MS,
+                        help="maximum cold-start time in ms for --startup")
+    args = parser.parse_args(argv)
+
+    if args.startup:
+        return startup_check(args.startup_budget)
+    if args.reruns:
+        rerun_latency(args.repeat, args.warmup)
+        print_figure_cache()
+        return 0
+
+    print(f"{'case (ms)':<28}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}")
+    for name, func in CASES:
+        if args.filter in name:
+            print(format_row(name, time_case(func, args.repeat, args.warmup)))
+
+    stats = expression_cache.stats()
+    print(f"\nexpression cache: {stats['hits']} hits, {stats['misses']} misses, "
+          f"{stats['evictions']} evictions ({stats['hit_rate']:.0%} hit rate)")
+    stats = symbolic_pool.stats()
+    print(f"symbolic pool: {stats['calls']} calls, {stats['timeouts']} timeouts, "
+          f"{stats['cancelled']} cancelled, {stats['queue_depth']} queued")
+    symbolic_pool.shutdown()
+    stats = symbolic_store.stats()
+    print(f"symbolic store: {stats['rows']} rows, {stats['bytes'] / 1024:.0f} KiB, "
+          f"{stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate)")
+    print_figure_cache()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6 @@
+"""MathCraft compute engine.
+
+The Streamlit script in ``app.py`` is only the presentation layer; all of the
+math behind each section lives in this package so it can be imported, timed
+and cached without a browser.
+"""
@@ -0,0 +1,205 @@
+"""Quiz Mode answer events in a local SQLite store, written in the background.
+
+Every submitted answer (question id, chosen option, correctness, seconds
+taken) is an event. ``record`` only puts it on an in-memory queue, so
+"Submit Answer" never waits on disk; a daemon thread drains the queue and
+writes each batch in one transaction, and the events still queued when
+the process exits are written then. The query methods aggregate the
+stored events into per-question or per-family difficulty and
+time-to-answer distributions.
+"""
+import atexit
+import bisect
+import os
+import queue
+import sqlite3
+import statistics
+import threading
+import time
+
+DEFAULT_PATH = os.path.join(
+    os.environ.get("MATHCRAFT_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "mathcraft"),
+    "answers.sqlite3",
+)
+
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_FLUSH_INTERVAL = 0.5  # seconds an event may wait for its batch
+DEFAULT_MAX_PENDING = 10_000  # queued events beyond this are dropped, not waited for
+
+# Upper edges (seconds) of the time-to-answer histogram; the last bin is open-ended
+TIME_BINS = (10, 20, 30, 60, 120, 300)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    id INTEGER PRIMARY KEY,
+    answered_at REAL NOT NULL,
+    session TEXT NOT NULL,
+    question_id TEXT NOT NULL,
+    choice INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    seconds REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS answers_question ON answers (question_id);
+"""
+
+# "rational_limit/17" -> "rational_limit"
+_FAMILY = "substr(question_id, 1, instr(question_id, '/') - 1)"
+
+
+class AnswerLog:
+    """Queue of answer events with one background writer, plus aggregate queries.
+
+    Any SQLite error (read-only disk, locked file) costs the events of that
+    batch and is counted in ``stats()``; it never reaches the quiz.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, batch_size=DEFAULT_BATCH_SIZE,
+                 flush_interval=DEFAULT_FLUSH_INTERVAL, max_pending=DEFAULT_MAX_PENDING):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()         # guards the connection
+        self._done = threading.Condition()    # guards the counters below
+        self._conn = None
+        self._writer = None
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+        self.batches = 0
+
+    def _connect(self):
+        """Open (once); in-memory if the path is unusable. Call with ``_lock`` held."""
+        if self._conn is None:
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(_SCHEMA)
+            except (OSError, sqlite3.Error):
+                conn = sqlite3.connect(":memory:", check_same_thread=False)
+                conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def record(self, question_id, choice, correct, seconds, session=""):
+        """Queue one answer event; returns at once, and drops the event if the queue is full."""
+        event = (time.time(), session, question_id, int(choice), int(bool(correct)), float(seconds))
+        with self._done:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="answer-log-writer", daemon=True)
+                self._writer.start()
+                atexit.register(self.flush)  # the daemon writer would otherwise die with them queued
+            try:
+                self._queue.put_nowait(event)
+            except queue.Full:
+                self.dropped += 1
+                return
+            self.enqueued += 1
+
+    def _write_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            # Let a batch fill for up to flush_interval, then write what arrived
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._write(batch)
+
+    def _write(self, batch):
+        ok = True
+        with self._lock:
+            try:
+                with self._connect() as conn:
+                    conn.executemany("INSERT INTO answers (answered_at, session, question_id, choice, correct, seconds) "
+                                     "VALUES (?, ?, ?, ?, ?, ?)", batch)
+            except sqlite3.Error:
+                ok = False
+        with self._done:
+            if ok:
+                self.written += len(batch)
+                self.batches += 1
+            else:
+                self.errors += len(batch)
+            self._done.notify_all()
+
+    def flush(self, timeout=5.0):
+        """Wait until every event queued so far is written (or failed); ``False`` on timeout."""
+        with self._done:
+            target = self.enqueued
+            return self._done.wait_for(lambda: self.written + self.errors >= target, timeout)
+
+    def _query(self, sql, args=()):
+        with self._lock:
+            try:
+                return self._connect().execute(sql, args).fetchall()
+            except sqlite3.Error:
+                return []
+
+    def question_stats(self, by="question"):
+        """Difficulty and time-to-answer per ``"question"`` id or question ``"family"``.
+
+        One dict per key, hardest first: ``answers``, ``accuracy`` (share
+        correct), ``difficulty`` (1 − accuracy), and ``median_seconds`` and
+        ``p90_seconds`` of the time to answer.
+        """
+        key = _FAMILY if by == "family" else "question_id"
+        times = {}
+        for name, seconds in self._query(f"SELECT {key}, seconds FROM answers ORDER BY {key}, seconds"):
+            times.setdefault(name, []).append(seconds)
+
+        rows = []
+        for name, answers, accuracy in self._query(f"SELECT {key}, COUNT(*), AVG(correct) FROM answers GROUP BY {key}"):
+            seconds = times.get(name, [])
+            rows.append({
+                by: name,
+                "answers": answers,
+                "accuracy": accuracy,
+                "difficulty": 1 - accuracy,
+                "median_seconds": statistics.median(seconds) if seconds else None,
+                "p90_seconds": seconds[min(int(0.9 * len(seconds)), len(seconds) - 1)] if seconds else None,
+            })
+        rows.sort(key=lambda row: row["difficulty"], reverse=True)
+        return rows
+
+    def time_distribution(self, question_id=None, family=None, bins=TIME_BINS):
+        """Time-to-answer histogram: ``[(low, high, count), ...]`` with ``high`` ``None`` for the last bin.
+
+        All answers, or only those to one ``question_id`` or ``family``.
+        """
+        if question_id is not None:
+            seconds = self._query("SELECT seconds FROM answers WHERE question_id = ?", (question_id,))
+        elif family is not None:
+            seconds = self._query(f"SELECT seconds FROM answers WHERE {_FAMILY} = ?", (family,))
+        else:
+            seconds = self._query("SELECT seconds FROM answers")
+        counts = [0] * (len(bins) + 1)
+        for (value,) in seconds:
+            counts[bisect.bisect_right(bins, value)] += 1
+        edges = (0, *bins, None)
+        return [(edges[i], edges[i + 1], count) for i, count in enumerate(counts)]
+
+    def stats(self):
+        """Writer counters: events queued, written, dropped (queue full) and lost to errors."""
+        with self._done:
+            return {
+                "path": self.path,
+                "pending": self.enqueued - self.written - self.errors,
+                "enqueued": self.enqueued,
+                "written": self.written,
+                "dropped": self.dropped,
+                "errors": self.errors,
+                "batches": self.batches,
+            }
+
+
+# Shared by every session in the server process
+answer_log = AnswerLog()
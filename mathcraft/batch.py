@@ -0,0 +1,185 @@
+"""Batch limit, asymptote and domain analysis of many functions from a file.
+
+Reads expressions from CSV (an ``expression`` column, optional ``id`` and
+``at`` columns) or JSONL (objects with the same keys, or bare strings) and
+runs the Asymptote Finder / Limit Calculator analysis on each::
+
+    python -m mathcraft.batch functions.csv -o results.jsonl
+    python -m mathcraft.batch functions.jsonl -o results.jsonl --jobs 8 --timeout 20
+
+SymPy runs in the shared symbolic worker pool, sized to ``--jobs`` worker
+processes (the CPU count by default). Each item has a deadline of
+``--timeout`` seconds for all of its SymPy calls together; an item that
+overruns it has its worker killed and is written with status ``timeout``.
+
+Results are appended to the output as one JSON line per item, in the order
+they finish, and flushed immediately. Re-running with the same output file
+resumes: items whose ``id`` is already there are skipped (``timeout`` and
+``partial`` ones are tried again with ``--retry-timeouts``). Results also land in the
+persistent symbolic store, so the app and later runs get them for free.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from mathcraft import engine
+from mathcraft.workers import SymbolicTimeout, symbolic_pool
+
+DEFAULT_ITEM_TIMEOUT = 30.0
+
+
+def read_items(path, column="expression"):
+    """``(id, expression, limit_points)`` per input row; ids default to the 1-based row number.
+
+    ``at`` holds extra limit points (``"0; 1"`` in CSV, a list or string in
+    JSONL); the Asymptote Finder's limits at ±∞ are always included.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith((".jsonl", ".ndjson")):
+            rows = (json.loads(line) for line in f if line.strip())
+            rows = ({column: row} if isinstance(row, str) else row for row in rows)
+        else:
+            rows = csv.DictReader(f)
+        for number, row in enumerate(rows, start=1):
+            points = row.get("at") or []
+            if isinstance(points, str):
+                points = [p.strip() for p in points.split(";") if p.strip()]
+            yield str(row.get("id") or number), row[column], [str(p) for p in points]
+
+
+def completed_ids(path, retry_timeouts=False):
+    """Ids already in the results file at ``path``, which is repaired for appending.
+
+    A run killed mid-write can leave a partial last line; it is cut off so
+    the next record starts on a line of its own.
+    """
+    if not os.path.exists(path):
+        return set()
+    with open(path, "rb+") as f:
+        data = f.read()
+        end = data.rfind(b"\n") + 1
+        if end != len(data):
+            f.truncate(end)
+
+    done = set()
+    for line in data[:end].splitlines():
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if not (retry_timeouts and record.get("status") in ("timeout", "partial")):
+            done.add(str(record["id"]))
+    return done
+
+
+def _text(value):
+    return None if value is None else str(value)
+
+
+def analyze(item_id, expression, limit_points=(), timeout=DEFAULT_ITEM_TIMEOUT):
+    """JSON-ready record of the limits, asymptotes and domain of one expression.
+
+    ``status`` is ``"ok"``, ``"partial"`` when single SymPy calls timed
+    out (their fields are ``None`` and listed in ``timed_out``),
+    ``"timeout"`` when the item overran its ``timeout`` seconds, or
+    ``"error"`` with the exception message.
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+
+    def overdue():
+        return time.monotonic() > deadline
+
+    record = {"id": item_id, "expression": expression}
+    try:
+        analysis = engine.find_asymptotes(expression, cancel=overdue)
+        limits = {"∞": _text(analysis["ha_pos"]), "-∞": _text(analysis["ha_neg"])}
+        for point in limit_points:
+            limits[point] = _text(engine.calculate_limit(expression, point, cancel=overdue))
+        record.update(
+            status="partial" if analysis["timed_out"] else "ok",
+            method=analysis["method"],
+            limits=limits,
+            vertical=None if analysis["vertical"] is None else [_text(v) for v in analysis["vertical"]],
+            holes=None if analysis["holes"] is None else [[_text(hx), _text(hy)] for hx, hy in analysis["holes"]],
+            domain=_text(analysis["domain"]),
+            timed_out=analysis["timed_out"],
+        )
+    except SymbolicTimeout:  # the deadline's cancel or a single call's pool timeout
+        record.update(status="timeout")
+    except Exception as exc:
+        record.update(status="error", error=f"{type(exc).__name__}: {exc}")
+    record["seconds"] = round(time.monotonic() - start, 3)
+    return record
+
+
+def run(items, output, jobs, timeout=DEFAULT_ITEM_TIMEOUT, done=frozenset()):
+    """Analyze ``items`` with ``jobs`` in flight, appending each record to ``output`` as it finishes.
+
+    Returns the count of records per status, plus ``skipped`` for items
+    whose id is in ``done``.
+    """
+    counts = {"ok": 0, "partial": 0, "timeout": 0, "error": 0, "skipped": 0}
+    lock = threading.Lock()
+
+    def finish(future):
+        record = future.result()
+        line = json.dumps(record, ensure_ascii=False)
+        with lock:
+            output.write(line + "\n")
+            output.flush()
+            counts[record["status"]] += 1
+
+    # A bounded window of submitted items keeps memory flat for any input size
+    pending = set()
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for item_id, expression, points in items:
+            if item_id in done:
+                counts["skipped"] += 1
+                continue
+            if len(pending) >= 2 * jobs:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    finish(future)
+            pending.add(executor.submit(analyze, item_id, expression, points, timeout))
+        for future in wait(pending).done:
+            finish(future)
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="CSV or JSONL (.jsonl/.ndjson) file of expressions")
+    parser.add_argument("-o", "--output", required=True, help="JSONL results file (appended to, resumable)")
+    parser.add_argument("--column", default="expression", help="field holding the expression")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_ITEM_TIMEOUT,
+                        help="seconds per item, all of its SymPy calls together")
+    parser.add_argument("--retry-timeouts", action="store_true",
+                        help="analyze items again whose earlier result timed out in whole or in part")
+    args = parser.parse_args(argv)
+
+    done = completed_ids(args.output, args.retry_timeouts)
+    symbolic_pool.resize(args.jobs, timeout=args.timeout)
+    start = time.monotonic()
+    try:
+        with open(args.output, "a", encoding="utf-8") as output:
+            counts = run(read_items(args.input, args.column), output, args.jobs, args.timeout, done)
+    finally:
+        symbolic_pool.shutdown()
+
+    elapsed = time.monotonic() - start
+    analyzed = counts["ok"] + counts["partial"] + counts["timeout"] + counts["error"]
+    print(f"{analyzed} analyzed in {elapsed:.1f} s ({analyzed / elapsed if elapsed else 0:.1f}/s): "
+          f"{counts['ok']} ok, {counts['partial']} partial, {counts['timeout']} timeouts, "
+          f"{counts['error']} errors, {counts['skipped']} already done", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""Per-function bundles of f and f′.
+
+The MVT section needs the same values of a fixed function and of its
+derivative on every rerun. A ``FunctionBundle`` derives f′ once from the
+expression text (``sp.diff``), compiles both to vectorized NumPy
+callables, and is shared by every session through an LRU keyed by the
+normalized text.
+"""
+import functools
+
+import numpy as np
+import sympy as sp
+
+from mathcraft.expressions import compile_expression, normalize_expression, x
+from mathcraft.sampling import evaluate_callable
+
+
+def _vectorize(expr):
+    """``expr`` as a float-array callable; constants broadcast, undefined values are NaN."""
+    func = sp.lambdify(x, expr, 'numpy')
+
+    def evaluate(x_vals):
+        return evaluate_callable(func, np.asarray(x_vals, dtype=float))
+    return evaluate
+
+
+class FunctionBundle:
+    """f and its derivative f′ of one expression in ``x``, both vectorized."""
+
+    __slots__ = ("text", "expr", "derivative_expr", "f", "f_prime")
+
+    def __init__(self, text):
+        self.text = text
+        self.expr = compile_expression(text).expr
+        self.derivative_expr = sp.diff(self.expr, x)
+        self.f = _vectorize(self.expr)
+        self.f_prime = _vectorize(self.derivative_expr)
+
+    def __repr__(self):
+        return f"FunctionBundle({self.text!r})"
+
+
+@functools.lru_cache(maxsize=128)
+def _bundle(key):
+    return FunctionBundle(key)
+
+
+def function_bundle(text):
+    """Shared ``FunctionBundle`` for ``text``, built on first use."""
+    return _bundle(normalize_expression(text))
@@ -0,0 +1,28 @@
+"""Custom Streamlit components with their own browser-side frontends.
+
+``limits_plot`` draws the Interactive Limits curve in the browser: the
+coefficients are sent once, the component's own sliders re-evaluate and
+redraw the rational function locally while they move, and the script only
+reruns when a slider is released. The frontend is a single static HTML
+file in ``mathcraft/frontend``, so there is nothing to build.
+"""
+import os
+
+import streamlit.components.v1 as components
+
+_FRONTEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend")
+
+_limits_plot = components.declare_component("limits_plot", path=os.path.join(_FRONTEND, "limits_plot"))
+
+
+def limits_plot(num_coeffs, den_coeffs, x_range, show_asymptote, key=None):
+    """Client-side plot and sliders for ``(x², x, constant)`` coefficient triples.
+
+    Returns ``(num_coeffs, den_coeffs, x_range)`` as of the last slider
+    release, or the arguments themselves before the first one.
+    """
+    value = _limits_plot(numerator=list(num_coeffs), denominator=list(den_coeffs), x_range=x_range,
+                         show_asymptote=show_asymptote, key=key, default=None)
+    if value is None:
+        return tuple(num_coeffs), tuple(den_coeffs), x_range
+    return tuple(value["numerator"]), tuple(value["denominator"]), value["x_range"]
@@ -0,0 +1,737 @@
+"""Pure compute functions behind each MathCraft section.
+
+Nothing in here touches Streamlit: every function takes plain inputs (the
+widget values) and returns plain data (floats, SymPy objects and NumPy
+arrays) that ``app.py`` renders and ``benchmark.py`` times.
+"""
+import functools
+import math
+import re
+import warnings
+
+import numpy as np
+import sympy as sp
+
+from mathcraft import riemann
+from mathcraft.bundles import function_bundle
+from mathcraft.cumulative import CumulativeIntegral
+from mathcraft.expressions import compile_expression, normalize_expression, parse_expression, x
+from mathcraft.polynomial import Polynomial, polynomial_division
+from mathcraft.poles import rational_singularities, sample_expression, segmented_sample
+from mathcraft.roots import find_roots
+from mathcraft.sampling import DEFAULT_BUDGET, adaptive_sample, evaluate, evaluate_callable
+from mathcraft.store import symbolic_store
+from mathcraft.workers import SymbolicCancelled, SymbolicTimeout, run_symbolic
+
+
+# --- INTERACTIVE LIMITS ---
+
+def limits_curve(num_coeffs, den_coeffs, x_range, budget=DEFAULT_BUDGET):
+    """Sample the quadratic-over-quadratic function of the Interactive Limits panel.
+
+    ``num_coeffs`` and ``den_coeffs`` are ``(x², x, constant)`` triples. The
+    curve is split at the real roots of the denominator.
+    """
+    numerator, denominator = Polynomial(num_coeffs), Polynomial(den_coeffs)
+    poles, holes = rational_singularities(numerator, denominator)
+    x_vals, y_vals, y_range = segmented_sample(lambda v: numerator(v) / denominator(v),
+                                               -x_range, x_range, poles + holes, budget)
+
+    b2 = den_coeffs[0]
+    return {
+        "x": x_vals,
+        "y": y_vals,
+        "poles": [p for p in poles if -x_range < p < x_range],
+        "y_range": y_range,
+        "limit": num_coeffs[0] / b2 if b2 != 0 else float('inf'),
+    }
+
+
+# --- ASYMPTOTE EXPLORER ---
+
+ASYMPTOTE_EXAMPLES = {
+    (1, 2): ["(2x + 1)/(x² - 4)", "(3x - 5)/(2x² + x + 1)"],
+    (2, 2): ["(3x² + 2x)/(x² - 1)", "(x² + 5)/(2x² - 3x + 1)"],
+    (3, 2): ["(x³ + 2x)/(x² - 1)", "(2x³ - x²)/(3x² + 4)"],
+}
+
+
+def degree_comparison(degree_num, degree_den):
+    """Return the ``(result, color)`` of the horizontal asymptote degree rule."""
+    if degree_num < degree_den:
+        return "Horizontal asymptote at y = 0", "green"
+    elif degree_num == degree_den:
+        return "Horizontal asymptote at y = (leading coefficient ratio)", "blue"
+    return "No horizontal asymptote (function grows without bound)", "red"
+
+
+def asymptote_examples(degree_num, degree_den):
+    """Example functions for a numerator/denominator degree pair."""
+    return ASYMPTOTE_EXAMPLES.get((degree_num, degree_den), [])
+
+
+# Numerator degree above the denominator's: slant (degree 1) or polynomial asymptotes
+OBLIQUE_EXAMPLES = [
+    "(x² + 1)/(x - 1)",
+    "(2x² - 3x + 1)/(x + 2)",
+    "(x³ - 1)/(x² + 1)",
+    "(x³ + 2x)/(x - 1)",
+]
+
+
+@functools.lru_cache(maxsize=64)
+def rational_polynomials(text):
+    """Numerator and denominator ``Polynomial``s of a rational function of ``x`` given as text.
+
+    Cached per text and shared, so callers must not modify them.
+    """
+    numerator, denominator = sp.fraction(sp.together(compile_expression(text).expr))
+    return (Polynomial([float(c) for c in sp.Poly(numerator, x).all_coeffs()]),
+            Polynomial([float(c) for c in sp.Poly(denominator, x).all_coeffs()]))
+
+
+def describe_asymptote(quotient):
+    """Text for the end-behaviour asymptote y = quotient(x)."""
+    if quotient.degree == 0:
+        return f"Horizontal asymptote at y = {quotient.leading:.3f}"
+    kind = "Oblique (slant)" if quotient.degree == 1 else f"Polynomial (degree {quotient.degree})"
+    return f"{kind} asymptote y = {quotient.format()}"
+
+
+def rational_curve(numerator, denominator, x_min=-10, x_max=10, budget=DEFAULT_BUDGET):
+    """Sample ``numerator / denominator`` split at its poles, with its end-behaviour asymptote.
+
+    Long division ``numerator = q * denominator + r`` (cached per coefficient
+    tuple) gives the asymptote y = q(x). Besides the curve, the result holds
+    ``quotient`` and ``remainder`` and, on the same grid, ``asymptote`` q(x)
+    and ``residual`` f(x) − q(x), all ``None`` for a zero denominator. The
+    residual is evaluated as r(x)/d(x), which is exact where subtracting
+    two large nearby values is not.
+    """
+    poles, holes = rational_singularities(numerator, denominator)
+    x_vals, y_vals, y_range = segmented_sample(lambda v: numerator(v) / denominator(v),
+                                               x_min, x_max, poles + holes, budget)
+    curve = {
+        "x": x_vals,
+        "y": y_vals,
+        "poles": [p for p in poles if x_min < p < x_max],
+        "y_range": y_range,
+        "quotient": None,
+        "remainder": None,
+        "asymptote": None,
+        "residual": None,
+    }
+    if denominator.is_zero:
+        return curve
+
+    quotient, remainder = polynomial_division(numerator.key(), denominator.key())
+    with np.errstate(divide='ignore', invalid='ignore'):
+        residual = np.where(np.isnan(y_vals), np.nan, remainder(x_vals) / denominator(x_vals))
+    curve.update(quotient=quotient, remainder=remainder, asymptote=quotient(x_vals), residual=residual)
+    return curve
+
+
+@functools.lru_cache(maxsize=32)
+def oblique_example(example, x_min=-10, x_max=10, budget=DEFAULT_BUDGET):
+    """Curve, asymptote and residual of an Asymptote Explorer oblique example.
+
+    Cached per example and shared, so callers must not modify the result.
+    """
+    numerator, denominator = rational_polynomials(example)
+    return rational_curve(numerator, denominator, x_min, x_max, budget)
+
+
+def example_curve(example, x_min=-10, x_max=10, budget=DEFAULT_BUDGET):
+    """Sample an Asymptote Explorer example, split at its vertical asymptotes."""
+    return sample_expression(example, x_min, x_max, budget, fallback_clip=50)
+
+
+# --- FUNCTION BUILDER ---
+
+def format_terms(coeffs, powers):
+    """Render builder terms as ``c*x^p + ...`` text."""
+    return " + ".join([f"{coeff}*x^{power}" if power > 0 else str(coeff)
+                       for coeff, power in zip(coeffs, powers)])
+
+
+def builder_polynomials(num_coeffs, num_powers, den_coeffs, den_powers):
+    """Merge Function Builder terms into numerator/denominator ``Polynomial`` arrays."""
+    return (Polynomial.from_terms(num_coeffs, num_powers),
+            Polynomial.from_terms(den_coeffs, den_powers))
+
+
+def builder_analysis(num_coeffs, num_powers, den_coeffs, den_powers):
+    """Degree and asymptote analysis of a Function Builder function.
+
+    Terms with the same power are combined first, so the degrees and leading
+    coefficients are those of the simplified polynomials. A numerator of
+    higher degree gets its slant or polynomial asymptote by long division.
+    """
+    numerator, denominator = builder_polynomials(num_coeffs, num_powers, den_coeffs, den_powers)
+
+    asymptote = None
+    if denominator.is_zero:
+        analysis = "Undefined (denominator is 0)"
+    elif numerator.is_zero or numerator.degree < denominator.degree:
+        asymptote = 0.0
+        analysis = "Horizontal asymptote at y = 0"
+    elif numerator.degree == denominator.degree:
+        asymptote = numerator.leading / denominator.leading
+        analysis = f"Horizontal asymptote at y = {asymptote:.3f}"
+    else:
+        quotient, _ = polynomial_division(numerator.key(), denominator.key())
+        analysis = describe_asymptote(quotient)
+
+    return {
+        "num_str": format_terms(num_coeffs, num_powers),
+        "den_str": format_terms(den_coeffs, den_powers),
+        "num_degree": numerator.degree,
+        "den_degree": denominator.degree,
+        "asymptote": asymptote,
+        "analysis": analysis,
+    }
+
+
+def builder_curve(num_coeffs, num_powers, den_coeffs, den_powers,
+                  x_min=-10, x_max=10, budget=DEFAULT_BUDGET):
+    """Sample a Function Builder function with its asymptote (see ``rational_curve``)."""
+    numerator, denominator = builder_polynomials(num_coeffs, num_powers, den_coeffs, den_powers)
+    return rational_curve(numerator, denominator, x_min, x_max, budget)
+
+
+# --- FTC VISUALIZER ---
+
+# Preset f(t) choices, as text in t
+FTC_PART1_FUNCTIONS = {
+    "t²": "t**2",
+    "sin(t)": "sin(t)",
+    "e^t": "exp(t)",
+    "1/(1+t²)": "1/(1 + t**2)",
+}
+
+# Seconds SymPy gets to find an antiderivative before F is left to quadrature
+ANTIDERIVATIVE_TIMEOUT = 1.0
+# Relative (and, near zero, absolute) deviation from the quadrature within
+# which an antiderivative's F is taken
+AGREEMENT_TOL = 1e-5
+
+# Integration spans are whole multiples of this, so moving a or the window
+# within one span reuses the integrated grid
+_SPAN_STEP = 5.0
+
+# Slider positions (0.1 steps) are grid points, so a and the window edges land on one
+_SLIDER_STEP = 0.1
+
+_T = re.compile(r"(?<![A-Za-z_])t(?![A-Za-z_])")
+
+
+def _t_to_x(text):
+    """``text`` in the variable t rewritten in x, the variable every engine function uses."""
+    return _T.sub("x", normalize_expression(text))
+
+
+@functools.lru_cache(maxsize=64)
+def _accumulation(text, lo, hi):
+    """Gauss–Kronrod grid of ``text`` (in x) on [lo, hi], shared by every lower bound and window."""
+    compiled = compile_expression(text)
+    steps = round((hi - lo) / _SLIDER_STEP)
+    return CumulativeIntegral(lambda v: evaluate(compiled, v), lo, hi,
+                              breakpoints=np.linspace(lo, hi, steps + 1))
+
+
+@functools.lru_cache(maxsize=64)
+def _special_function_callable(expr):
+    """``expr`` as a NumPy callable; SciPy supplies erf, Si and the other special functions."""
+    return sp.lambdify(x, expr, modules=["numpy", "scipy"])
+
+
+def ftc_part1(text, a=0.0, x_min=0.0, x_max=5.0, cancel=None):
+    """f(t) and the accumulation function F(x) = ∫ₐˣ f(t) dt on [x_min, x_max].
+
+    ``text`` is any f(t). F comes from one adaptive Gauss–Kronrod pass,
+    cached per function and span, with ``error`` the accumulated error
+    estimate at each point and ``max_error`` its largest value. Past a
+    point where the integral diverges, F and ``error`` are NaN; ``defined``
+    marks where F has a value. When SymPy
+    finds an antiderivative within ``ANTIDERIVATIVE_TIMEOUT`` seconds and
+    it agrees with the quadrature to ``AGREEMENT_TOL``, F is taken from it
+    instead (still NaN past a divergence): ``method`` is then
+    ``"symbolic"``, ``antiderivative`` its LaTeX and ``max_error`` the
+    largest deviation between the two.
+    """
+    text = _t_to_x(text)
+    lo = _SPAN_STEP * math.floor(min(a, x_min) / _SPAN_STEP)
+    hi = _SPAN_STEP * math.ceil(max(a, x_max) / _SPAN_STEP)
+    if hi == lo:
+        hi += _SPAN_STEP
+    integral = _accumulation(text, lo, hi)
+    F, error = integral.from_lower(a)
+
+    window = (integral.x >= x_min - 1e-9) & (integral.x <= x_max + 1e-9)
+    x_vals, F, error = integral.x[window], F[window], error[window]
+    result = {
+        "x": x_vals,
+        "f": integral.f_vals[window],
+        "F": F,
+        "a": a,
+        "error": error,
+        "max_error": float(np.nanmax(error)) if np.isfinite(error).any() else float("nan"),
+        "defined": np.isfinite(F),
+        "method": "quadrature",
+        "antiderivative": None,
+    }
+
+    try:
+        antiderivative = _cached_symbolic(_antiderivative, text, timeout=ANTIDERIVATIVE_TIMEOUT, cancel=cancel)
+    except SymbolicCancelled:
+        raise
+    except Exception:  # timed out or SymPy failed: the quadrature stands
+        antiderivative = None
+    if antiderivative is None:
+        return result
+
+    try:
+        G = _special_function_callable(antiderivative)
+        F_exact = evaluate_callable(G, np.append(x_vals, a))
+    except (NameError, TypeError, ValueError, ImportError):  # no NumPy/SciPy equivalent
+        return result
+    F_exact = F_exact[:-1] - F_exact[-1]
+    # Use it only where it agrees with the quadrature, which catches branch cuts;
+    # an antiderivative continues across a pole, where the integral diverges
+    both = np.isfinite(F_exact) & np.isfinite(F)
+    deviation = np.abs(F_exact[both] - F[both])
+    if both.any() and np.all(deviation <= AGREEMENT_TOL * (1 + np.abs(F[both]))):
+        result.update(F=np.where(both, F_exact, F), max_error=float(deviation.max()),
+                      method="symbolic", antiderivative=sp.latex(antiderivative))
+    return result
+
+
+# f(x)
+FTC_PART2_FUNCTIONS = {
+    "x²": "x**2",
+    "sin(x)": "sin(x)",
+    "x³ - 2x": "x**3 - 2*x",
+}
+
+
+# Seconds SymPy gets for a definite integral before quadrature takes over
+DEFINITE_INTEGRAL_TIMEOUT = 0.5
+
+
+@functools.lru_cache(maxsize=32)
+def _ftc_part2_curve(text, budget):
+    """f of ``text`` on [-5, 5], sampled once per function for every pair of bounds."""
+    compiled = compile_expression(text)
+    x_vals, y_vals = adaptive_sample(lambda v: evaluate(compiled, v), -5, 5, budget)
+    return x_vals, y_vals
+
+
+def _quadrature(text, a, b):
+    """``(value, error)`` of ∫ₐᵇ of ``text`` dx by ``scipy.integrate.quad``."""
+    from scipy.integrate import quad  # ~500 ms; only needed without a symbolic value
+    compiled = compile_expression(text)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # divergence shows up as a large error bound
+        value, error = quad(lambda v: evaluate(compiled, np.array([v]))[0], a, b, limit=200)
+    return float(value), float(error)
+
+
+@functools.lru_cache(maxsize=1024)
+def _settled_integral(text, a, b):
+    """``definite_integral`` once SymPy has answered; raises ``SymbolicTimeout``, which is not cached."""
+    try:
+        value = _cached_symbolic(_definite_integral, text, a, b, timeout=DEFINITE_INTEGRAL_TIMEOUT)
+    except SymbolicTimeout:
+        raise
+    except Exception:  # SymPy failed: fall back to quadrature
+        value = None
+    if value is not None:
+        return value, 0.0, "symbolic"
+    return (*_quadrature(text, a, b), "quadrature")
+
+
+def definite_integral(text, a, b):
+    """``(value, error, method)`` of ∫ₐᵇ of ``text`` dx.
+
+    SymPy gets ``DEFINITE_INTEGRAL_TIMEOUT`` seconds on the worker pool
+    (``method`` ``"symbolic"``, ``error`` 0); if it times out, fails or
+    leaves the integral unevaluated, adaptive Gauss–Kronrod quadrature
+    (``scipy.integrate.quad``) gives the value and its error bound.
+    Results are cached per (expression, a, b), except a quadrature value
+    standing in for a timeout (a cold worker pool can cause one), so SymPy
+    gets another try on the next call.
+    """
+    try:
+        return _settled_integral(text, a, b)
+    except SymbolicTimeout:
+        return (*_quadrature(text, a, b), "quadrature")
+
+
+@functools.lru_cache(maxsize=32)
+def _function_latex(text):
+    return sp.latex(compile_expression(text).expr)
+
+
+@functools.lru_cache(maxsize=1024)
+def _ftc_part2_shading(text, a, b, budget):
+    """Shaded region from a to b: the curve's own samples strictly inside, plus f at the bounds."""
+    x_vals, y_vals = _ftc_part2_curve(text, budget)
+    f_a, f_b = evaluate(compile_expression(text), np.array([a, b]))
+    inside = (x_vals > min(a, b)) & (x_vals < max(a, b))
+    step = 1 if a <= b else -1
+    x_fill = np.concatenate([[a], x_vals[inside][::step], [b]])
+    y_fill = np.concatenate([[f_a], y_vals[inside][::step], [f_b]])
+    return x_fill, y_fill
+
+
+@functools.lru_cache(maxsize=1024)
+def _antiderivative_at(text, a, b):
+    """``(F(a), F(b), LaTeX of F)`` once SymPy has answered, ``None`` each without a usable F.
+
+    Raises ``SymbolicTimeout``, which is not cached, so SymPy gets another try.
+    """
+    try:
+        antiderivative = _cached_symbolic(_antiderivative, text, timeout=ANTIDERIVATIVE_TIMEOUT)
+    except SymbolicTimeout:
+        raise
+    except Exception:  # the calculation box then shows the value alone
+        antiderivative = None
+    if antiderivative is None:
+        return None, None, None
+    try:
+        G = _special_function_callable(antiderivative)
+        F_a, F_b = map(float, evaluate_callable(G, np.array([a, b])))
+    except (NameError, TypeError, ValueError, ImportError):  # no NumPy/SciPy equivalent
+        return None, None, None
+    return F_a, F_b, sp.latex(antiderivative)
+
+
+def ftc_part2(func_choice, a, b, budget=DEFAULT_BUDGET):
+    """Definite integral of an FTC Part 2 function over [a, b], plus plot samples.
+
+    ``integral`` comes from ``definite_integral`` (with its ``error`` and
+    ``method``). ``F_a``/``F_b`` evaluate SymPy's antiderivative, and are
+    ``None`` with ``anti_latex`` when it has none within its time budget or
+    it cannot be evaluated numerically.
+    The shaded region reuses the curve's samples between a and b. Every
+    part is cached per (function, a, b) except after a SymPy timeout.
+    """
+    text = FTC_PART2_FUNCTIONS[func_choice]
+    x_vals, y_vals = _ftc_part2_curve(text, budget)
+    integral, error, method = definite_integral(text, a, b)
+    x_fill, y_fill = _ftc_part2_shading(text, a, b, budget)
+    try:
+        F_a, F_b, anti_latex = _antiderivative_at(text, a, b)
+    except SymbolicTimeout:
+        F_a = F_b = anti_latex = None
+
+    return {
+        "x": x_vals,
+        "y": y_vals,
+        "x_fill": x_fill,
+        "y_fill": y_fill,
+        "F_a": F_a,
+        "F_b": F_b,
+        "integral": integral,
+        "error": error,
+        "method": method,
+        "func_latex": _function_latex(text),
+        "anti_latex": anti_latex,
+    }
+
+
+# --- MVT EXPLORER ---
+
+# f(x), title
+MVT_FUNCTIONS = {
+    "x²": ("x**2", "f(x) = x²"),
+    "x³ - 3x": ("x**3 - 3*x", "f(x) = x³ - 3x"),
+    "sin(x)": ("sin(x)", "f(x) = sin(x)"),
+    "x³ - 2x² + x + 1": ("x**3 - 2*x**2 + x + 1", "f(x) = x³ - 2x² + x + 1"),
+    "ln(x+2)": ("log(x + 2)", "f(x) = ln(x+2)"),
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def mvt_analysis(mvt_function, a, b, budget=DEFAULT_BUDGET):
+    """Every Mean Value Theorem point c on (a, b) and the curve samples around it.
+
+    The c values are the roots of f'(x) − (f(b) − f(a))/(b − a) found
+    numerically (``roots.find_roots``); ``c`` is the first of them, or
+    ``None`` if there is none (f is not differentiable on all of (a, b)).
+    Cached per (function, a, b) and shared, so callers must not modify it.
+    """
+    text, func_title = MVT_FUNCTIONS[mvt_function]
+    bundle = function_bundle(text)
+
+    f_a, f_b = bundle.f([a, b])
+    avg_rate = (f_b - f_a) / (b - a)
+
+    # Find c value(s) where f'(c) = average rate
+    c_values = find_roots(lambda v: bundle.f_prime(v) - avg_rate, a, b)
+    c = float(c_values[0]) if c_values.size else None
+    f_c_values = bundle.f(c_values)
+
+    x_vals, y_vals = adaptive_sample(bundle.f, min(a - 1, -5), max(b + 1, 5), budget)
+
+    return {
+        "title": func_title,
+        "f_a": float(f_a),
+        "f_b": float(f_b),
+        "avg_rate": float(avg_rate),
+        "c_values": c_values,
+        "f_c_values": f_c_values,
+        "c": c,
+        "f_c": None if c is None else float(f_c_values[0]),
+        "f_prime_c": None if c is None else float(bundle.f_prime(c)),
+        "x": x_vals,
+        "y": y_vals,
+    }
+
+
+# --- LIMIT CALCULATOR ---
+
+def limit_target(limit_point):
+    """Map the Limit Calculator's point choice to a SymPy target."""
+    if limit_point == "∞":
+        return sp.oo
+    elif limit_point == "-∞":
+        return -sp.oo
+    return float(limit_point)
+
+
+def _limit(text, target):
+    """lim(x→target) of ``text``; runs in a symbolic worker process."""
+    return sp.limit(compile_expression(text).expr, x, target)
+
+
+def _continuous_domain(text):
+    """Domain of ``text`` over the reals, or ``None``; runs in a symbolic worker process."""
+    try:
+        return sp.calculus.util.continuous_domain(compile_expression(text).expr, x, sp.S.Reals)
+    except (NotImplementedError, TypeError, ValueError):
+        return None
+
+
+def _denominator_zeros(text):
+    """Real zeros of the denominator of ``text``, or ``None`` without one; runs in a symbolic worker process.
+
+    Zeros in terms of other symbols are kept unless SymPy knows they are not real.
+    """
+    _, den = sp.fraction(sp.together(compile_expression(text).expr))
+    if not den.has(x):
+        return None
+    return [root for root in sp.solve(den, x) if root.is_real is not False]
+
+
+def _infinite_limit(sign, degree_gap, direction):
+    """lim of a rational function whose numerator outgrows the denominator by ``degree_gap``."""
+    return sign * direction ** degree_gap * sp.oo
+
+
+def _written_denominator_zeros(text):
+    """Real zeros of every polynomial denominator in ``text`` as written.
+
+    SymPy cancels ``x/(x*(x - 2))`` to ``1/(x - 2)`` while parsing, losing
+    the hole at 0, so the denominators are read from the unevaluated parse.
+    """
+    written = parse_expression(text, evaluate=False)
+    zeros = set()
+    for node in sp.preorder_traversal(written):
+        if node.is_Pow and node.exp.is_negative and node.base.has(x):
+            base = node.base.doit()
+            if base.is_polynomial(x):
+                zeros.update(sp.Poly(base, x).real_roots())
+    return sorted(zeros, key=float)
+
+
+def _rational_asymptotes(text):
+    """Asymptotes and domain of a rational ``text`` by polynomial arithmetic, or ``None``.
+
+    Runs in a symbolic worker process; ``None`` unless ``text`` is a ratio
+    of polynomials in ``x`` alone. Degrees and leading coefficients of
+    the cancelled fraction give the horizontal behavior; real roots of the
+    cancelled denominator are vertical asymptotes, and the other real zeros
+    of the denominators as written are removable holes.
+    """
+    expr = compile_expression(text).expr
+    # Other symbols (1/(x - a)) leave roots and coefficients that are not numbers
+    if not expr.free_symbols <= {x} or not expr.is_rational_function(x):
+        return None
+    reduced = sp.cancel(sp.together(expr))
+    reduced_num, reduced_den = (sp.Poly(part, x) for part in sp.fraction(reduced))
+
+    gap = reduced_num.degree() - reduced_den.degree()
+    ratio = reduced_num.LC() / reduced_den.LC()
+    if reduced_num.is_zero or gap < 0:
+        ha_pos = ha_neg = sp.Integer(0)
+    elif gap == 0:
+        ha_pos = ha_neg = ratio
+    else:
+        ha_pos = _infinite_limit(sp.sign(ratio), gap, 1)
+        ha_neg = _infinite_limit(sp.sign(ratio), gap, -1)
+
+    vertical = sorted(set(reduced_den.real_roots()), key=float)
+    zeros = sorted(set(vertical).union(_written_denominator_zeros(text)), key=float)
+    holes = [(root, reduced.subs(x, root)) for root in zeros if root not in vertical]
+
+    # Roots of quintics and beyond have no radicals; show them as decimals
+    def shown(value):
+        return value.evalf(6) if value.has(sp.CRootOf) else value
+
+    return {
+        "ha_pos": ha_pos,
+        "ha_neg": ha_neg,
+        "vertical": [shown(root) for root in vertical],
+        "holes": [(shown(root), shown(y)) for root, y in holes],
+        "domain": sp.S.Reals - sp.FiniteSet(*map(shown, zeros)),
+    }
+
+
+def _antiderivative(text):
+    """An antiderivative of ``text``, or ``None``; runs in a symbolic worker process."""
+    antiderivative = sp.integrate(compile_expression(text).expr, x)
+    return None if antiderivative.has(sp.Integral) else antiderivative
+
+
+def _definite_integral(text, a, b):
+    """∫ₐᵇ of ``text`` dx as a float, or ``None``; runs in a symbolic worker process."""
+    value = sp.integrate(compile_expression(text).expr, (x, sp.Float(a), sp.Float(b)))
+    if value.has(sp.Integral):
+        return None
+    value = complex(value.evalf())
+    if abs(value.imag) > 1e-12 or not np.isfinite(value.real):
+        return None
+    return value.real
+
+
+def _cached_symbolic(func, text, *args, timeout=None, cancel=None):
+    """``func(text, *args)`` from the persistent store, else run on the worker pool and stored.
+
+    Timeouts and errors are not stored, so a later attempt can still succeed.
+    """
+    key = symbolic_store.make_key(func.__name__, normalize_expression(text), args)
+    found, value = symbolic_store.get(key)
+    if not found:
+        value = run_symbolic(func, text, *args, timeout=timeout, cancel=cancel)
+        symbolic_store.put(key, value)
+    return value
+
+
+def calculate_limit(text, limit_point, cancel=None):
+    """lim(x→limit_point) of the user's expression.
+
+    Served from the persistent symbolic store when known; otherwise runs on
+    the symbolic worker pool and raises ``SymbolicTimeout`` if SymPy does
+    not finish within the pool's time budget.
+    """
+    return _cached_symbolic(_limit, text, limit_target(limit_point), cancel=cancel)
+
+
+# --- ASYMPTOTE FINDER ---
+
+def find_asymptotes(text, cancel=None):
+    """Horizontal and vertical asymptotes, holes and domain of the user's expression.
+
+    Rational inputs take a fast path of polynomial arithmetic
+    (``method`` ``"rational"``): ``vertical`` lists true vertical
+    asymptotes and ``holes`` the removable ``(x, y)`` points. Anything
+    else falls back to two ``sp.limit`` calls, the zeros of the
+    denominator (``vertical``, ``None`` without one; ``holes`` is then
+    ``None``) and ``continuous_domain`` (``method`` ``"symbolic"``).
+
+    ``domain`` is ``None`` when SymPy cannot determine it. Each SymPy result
+    comes from the persistent symbolic store or runs on the worker pool
+    with its own time budget; fields whose call timed out are ``None`` and
+    listed in ``timed_out``.
+    """
+    analysis = {"ha_pos": None, "ha_neg": None, "vertical": None, "holes": None, "domain": None,
+                "method": "rational", "timed_out": []}
+    try:
+        rational = _cached_symbolic(_rational_asymptotes, text, cancel=cancel)
+    except SymbolicCancelled:
+        raise
+    except SymbolicTimeout:
+        rational = None
+    if rational is not None:
+        analysis.update(rational)
+        return analysis
+
+    analysis["method"] = "symbolic"
+    calls = {
+        "ha_pos": (_limit, text, sp.oo),
+        "ha_neg": (_limit, text, -sp.oo),
+        "vertical": (_denominator_zeros, text),
+        "domain": (_continuous_domain, text),
+    }
+    for field, (func, *args) in calls.items():
+        try:
+            analysis[field] = _cached_symbolic(func, *args, cancel=cancel)
+        except SymbolicCancelled:
+            raise
+        except SymbolicTimeout:
+            analysis["timed_out"].append(field)
+    return analysis
+
+
+# --- RIEMANN SUMS ---
+
+RIEMANN_FUNCTIONS = {
+    "x**2": lambda v: v**2,
+    "sin(x)": np.sin,
+    "x**3 - 2*x": lambda v: v**3 - 2*v,
+    "1/x": lambda v: 1/v,
+}
+
+RIEMANN_POLES = {"1/x": [0.0]}
+
+# Closed-form ∫ₐᵇ f(x) dx where it is shown for comparison
+RIEMANN_EXACT = {
+    "x**2": lambda a, b: (b**3 - a**3) / 3,
+    "sin(x)": lambda a, b: -np.cos(b) + np.cos(a),
+    "x**3 - 2*x": lambda a, b: (b**4 - a**4) / 4 - (b**2 - a**2),
+    # ln|b| - ln|a| only holds when the interval does not cross the pole
+    "1/x": lambda a, b: np.log(b / a) if a * b > 0 else None,
+}
+
+
+def riemann_exact(riemann_func, a, b):
+    """Closed-form ∫ₐᵇ f(x) dx, or ``None`` if it is not known or diverges."""
+    exact = RIEMANN_EXACT.get(riemann_func)
+    return None if exact is None else exact(a, b)
+
+
+def riemann_sum(riemann_func, a, b, n_rectangles, method, budget=DEFAULT_BUDGET):
+    """Riemann sum of ``riemann_func`` on [a, b] with its display bars and curve samples.
+
+    ``method`` is ``"Left"``, ``"Right"`` or ``"Midpoint"``. The sum uses all
+    ``n_rectangles``; ``bars`` holds at most ``riemann.DISPLAY_BUDGET`` merged
+    ``(left, right, height)`` arrays for drawing, each standing for
+    ``group`` rectangles.
+    """
+    f = RIEMANN_FUNCTIONS[riemann_func]
+
+    poles = RIEMANN_POLES.get(riemann_func, [])
+    x_vals, y_vals, y_range = segmented_sample(f, a, b, poles, budget)
+
+    dx = (b - a) / n_rectangles
+    edges, heights = riemann.rectangle_heights(f, a, b, n_rectangles, method)
+    left, right, bar_heights, group = riemann.display_rectangles(edges, heights)
+
+    return {
+        "x": x_vals,
+        "y": y_vals,
+        "poles": [p for p in poles if min(a, b) < p < max(a, b)],
+        "y_range": y_range,
+        "dx": dx,
+        "sum": riemann.riemann_total(heights, dx),
+        "bars": (left, right, bar_heights),
+        "group": group,
+        "exact": riemann_exact(riemann_func, a, b),
+    }
+
+
+def riemann_convergence(riemann_func, a, b):
+    """Error-vs-n sweep of every summation rule for ``riemann_func`` on [a, b]."""
+    return riemann.convergence_study(RIEMANN_FUNCTIONS[riemann_func], a, b,
+                                     riemann_exact(riemann_func, a, b))
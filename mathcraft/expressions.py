@@ -0,0 +1,130 @@
+"""Process-wide cache of parsed and compiled user expressions.
+
+Every Streamlit session runs in the same server process, so an expression
+typed by one student is parsed (``parse_expr``) and compiled to a NumPy
+callable (``lambdify``) once and then served to everybody from a
+size-bounded LRU.
+"""
+import threading
+from collections import OrderedDict
+
+import sympy as sp
+from sympy.parsing.sympy_parser import (
+    convert_xor,
+    implicit_multiplication,
+    parse_expr,
+    standard_transformations,
+)
+
+x = sp.Symbol('x')
+
+# Example strings use textbook notation such as "(2x + 1)/(x² - 4)"
+_SUPERSCRIPTS = {"²": "**2", "³": "**3"}
+_TRANSFORMATIONS = standard_transformations + (implicit_multiplication, convert_xor)
+
+
+def normalize_expression(text):
+    """Canonical cache key for ``text``: superscripts expanded, ``^`` as ``**``, single spaces."""
+    for superscript, power in _SUPERSCRIPTS.items():
+        text = text.replace(superscript, power)
+    return " ".join(text.replace("^", "**").split())
+
+
+def parse_expression(text, evaluate=True):
+    """Parse user or example text into a SymPy expression in ``x`` (uncached).
+
+    Accepts Python syntax as well as ``^`` for powers, ``²``/``³`` and
+    implicit multiplication (``2x``). With ``evaluate=False`` the expression
+    keeps its written form, e.g. common factors are not cancelled.
+    """
+    return parse_expr(normalize_expression(text), local_dict={'x': x},
+                      transformations=_TRANSFORMATIONS, evaluate=evaluate)
+
+
+class CompiledExpression:
+    """A parsed expression and its vectorized NumPy callable.
+
+    ``func`` is ``None`` when the expression has free symbols other than
+    ``x`` or cannot be lambdified; callers fall back to ``expr.subs``.
+    """
+
+    __slots__ = ("text", "expr", "func")
+
+    def __init__(self, text, expr, func):
+        self.text = text
+        self.expr = expr
+        self.func = func
+
+    @classmethod
+    def from_text(cls, text):
+        expr = parse_expression(text)
+        func = None
+        if expr.free_symbols <= {x}:
+            try:
+                func = sp.lambdify(x, expr, modules="numpy")
+            except (SyntaxError, TypeError, NameError):
+                func = None
+        return cls(text, expr, func)
+
+
+class ExpressionCache:
+    """Thread-safe LRU of ``CompiledExpression`` keyed by normalized text."""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, text):
+        """Return the compiled form of ``text``, parsing it on a miss.
+
+        Parse errors propagate to the caller and are not cached.
+        """
+        key = normalize_expression(text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        # Parse outside the lock so one slow expression doesn't block other sessions
+        entry = CompiledExpression.from_text(key)
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def stats(self):
+        """Hit/miss/eviction counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+expression_cache = ExpressionCache()
+
+
+def compile_expression(text):
+    """Cached ``CompiledExpression`` for ``text`` from the process-wide cache."""
+    return expression_cache.get(text)
@@ -0,0 +1,102 @@
+"""Process-wide cache of built Plotly figures for fixed-choice inputs.
+
+Many figures depend only on a small, discrete set of inputs: the four FTC
+Part 1 functions, the Asymptote Explorer examples, the MVT function list
+with endpoints on 0.1 slider steps. Rebuilding ``go.Figure`` /
+``make_subplots`` for them on every rerun costs 10-20 ms, so each built
+figure is kept in an LRU keyed by its input tuple and shared by every
+session, bounded by the figures' serialized size.
+
+The cached value is the ``go.Figure`` itself rather than its JSON:
+``st.plotly_chart`` re-validates dicts and JSON strings (as long as the
+build), but serializes a ``Figure`` directly. Cached figures are shared,
+so callers must not modify them.
+"""
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class FigureCache:
+    """Thread-safe LRU of figures keyed by ``(kind, *inputs)``, bounded by ``max_bytes`` of JSON."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (figure, size)
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._kinds = {}  # kind -> [hits, misses]
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, build):
+        """The figure cached under ``key``, calling ``build()`` to make it on a miss.
+
+        ``key[0]`` names the kind of figure for ``stats()``; the rest must be
+        hashable inputs that fully determine the figure. Errors from
+        ``build`` propagate and are not cached.
+        """
+        with self._lock:
+            counts = self._kinds.setdefault(key[0], [0, 0])
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                counts[0] += 1
+                return entry[0]
+            self.misses += 1
+            counts[1] += 1
+
+        # Build outside the lock so one slow figure doesn't block other sessions
+        import plotly.io as pio
+        figure = build()
+        size = len(pio.to_json(figure, validate=False))
+
+        with self._lock:
+            if key in self._entries:  # another session built it meanwhile
+                return self._entries[key][0]
+            if size > self.max_bytes:
+                return figure
+            self._entries[key] = (figure, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+        return figure
+
+    def stats(self):
+        """Size, hit/miss/eviction counters and the hit rate per figure kind."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "kinds": {
+                    kind: {"hits": hits, "misses": misses, "hit_rate": hits / (hits + misses)}
+                    for kind, (hits, misses) in self._kinds.items()
+                },
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._kinds.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+# Shared by every session in the server process
+figure_cache = FigureCache()
+
+
+def cached_figure(key, build):
+    """Figure for ``key`` from the process-wide cache (see ``FigureCache.get``)."""
+    return figure_cache.get(key, build)
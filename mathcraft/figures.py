@@ -0,0 +1,355 @@
+"""Plotly figure builders for the engine results.
+
+Each builder turns the dict returned by the matching ``engine`` function into
+a ``go.Figure``; ``app.py`` only hands the figure to ``st.plotly_chart``.
+"""
+import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from mathcraft import riemann
+
+
+def _show_poles(fig, result):
+    """Mark vertical asymptotes and fit the y-axis to the curve rather than the poles."""
+    # Plain paper-referenced shapes; add_vline costs several ms per line
+    for pole in result.get("poles", []):
+        fig.add_shape(type="line", x0=pole, x1=pole, y0=0, y1=1, yref="paper",
+                      line=dict(color="gray", dash="dot"))
+        fig.add_annotation(x=pole, y=1, yref="paper", text=f"x = {pole:.3g}",
+                           showarrow=False, yanchor="bottom")
+    if result.get("y_range") is not None:
+        fig.update_yaxes(range=result["y_range"])
+
+
+def limits_figure(curve, show_asymptote):
+    """Interactive Limits graph with the optional horizontal asymptote."""
+    fig = go.Figure()
+
+    # Add function curve
+    fig.add_trace(go.Scatter(
+        x=curve["x"], y=curve["y"],
+        mode='lines',
+        name='f(x)',
+        line=dict(color='blue', width=3)
+    ))
+
+    # Add horizontal asymptote
+    limit_val = curve["limit"]
+    if show_asymptote and np.isfinite(limit_val):
+        fig.add_hline(
+            y=limit_val,
+            line_dash="dash",
+            line_color="red",
+            annotation_text=f"y = {limit_val:.3f}",
+            annotation_position="top right"
+        )
+
+    _show_poles(fig, curve)
+
+    fig.update_layout(
+        title="Interactive Function Graph",
+        xaxis_title="x",
+        yaxis_title="f(x)",
+        height=500,
+        showlegend=True
+    )
+    return fig
+
+
+def example_figure(curve, example, degree_num, degree_den):
+    """Asymptote Explorer graph of a degree-comparison example."""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=curve["x"], y=curve["y"],
+        mode='lines',
+        name=f'f(x) = {example}',
+        line=dict(width=3)
+    ))
+
+    # Add horizontal asymptote if applicable
+    if degree_num < degree_den:
+        fig.add_hline(y=0, line_dash="dash", line_color="red",
+                      annotation_text="y = 0")
+
+    _show_poles(fig, curve)
+
+    fig.update_layout(
+        title=f"Graph of f(x) = {example}",
+        xaxis_title="x",
+        yaxis_title="f(x)",
+        height=400
+    )
+    return fig
+
+
+def oblique_figure(curve, example):
+    """Asymptote Explorer graph of an oblique example over its residual f(x) − q(x)."""
+    quotient = curve["quotient"]
+    fig = make_subplots(
+        rows=2, cols=1,
+        row_heights=[0.65, 0.35],
+        shared_xaxes=True,
+        subplot_titles=[f'f(x) = {example}', 'f(x) − q(x) = r(x)/d(x) → 0'],
+        vertical_spacing=0.12
+    )
+    fig.add_trace(
+        go.Scatter(x=curve["x"], y=curve["y"], mode='lines', name='f(x)', line=dict(width=3)),
+        row=1, col=1
+    )
+    fig.add_trace(
+        go.Scatter(x=curve["x"], y=curve["asymptote"], mode='lines',
+                   name=f'q(x) = {quotient.format()}', line=dict(color='red', dash='dash')),
+        row=1, col=1
+    )
+    fig.add_trace(
+        go.Scatter(x=curve["x"], y=curve["residual"], mode='lines', name='f(x) − q(x)',
+                   line=dict(color='green', width=2)),
+        row=2, col=1
+    )
+    fig.add_shape(type="line", x0=0, x1=1, xref="x2 domain", y0=0, y1=0, yref="y2",
+                  line=dict(color="gray", dash="dash"))
+
+    # The residual shares f's poles: one paper-high line marks both rows
+    for pole in curve["poles"]:
+        fig.add_shape(type="line", x0=pole, x1=pole, y0=0, y1=1, yref="paper",
+                      line=dict(color="gray", dash="dot"))
+    if curve["y_range"] is not None:
+        fig.update_yaxes(range=curve["y_range"], row=1, col=1)
+        # Fit the residual row to its 2nd-98th percentile, not the pole spikes
+        finite = curve["residual"][np.isfinite(curve["residual"])]
+        if finite.size:
+            low, high = np.percentile(finite, [2, 98])
+            pad = 0.1 * (high - low) or 1.0
+            fig.update_yaxes(range=[low - pad, high + pad], row=2, col=1)
+
+    fig.update_layout(height=600, showlegend=True)
+    fig.update_xaxes(title_text="x", row=2, col=1)
+    return fig
+
+
+def builder_figure(curve, asymptote):
+    """Function Builder graph; ``asymptote`` is the horizontal asymptote or ``None``.
+
+    Without a horizontal asymptote the curve's slant or polynomial asymptote
+    (``curve["asymptote"]``) is drawn instead.
+    """
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=curve["x"], y=curve["y"],
+        mode='lines',
+        name='f(x)',
+        line=dict(width=3, color='purple')
+    ))
+
+    # Add horizontal asymptote if it exists, else the slant/polynomial one
+    if asymptote is not None:
+        fig.add_hline(y=asymptote, line_dash="dash", line_color="red",
+                      annotation_text=f"y = {asymptote:.3f}")
+    elif curve["quotient"] is not None:
+        fig.add_trace(go.Scatter(
+            x=curve["x"], y=curve["asymptote"],
+            mode='lines',
+            name=f'y = {curve["quotient"].format()}',
+            line=dict(color='red', dash='dash')
+        ))
+
+    _show_poles(fig, curve)
+
+    fig.update_layout(
+        title="Your Custom Function",
+        xaxis_title="x",
+        yaxis_title="f(x)",
+        height=400
+    )
+    return fig
+
+
+def ftc_part1_figure(result, label):
+    """Stacked f(t) / F(x) graphs for FTC Part 1."""
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=['f(t) - Original Function',
+                        f'F(x) = ∫ₐˣf(t)dt, a = {result["a"]:g} - Accumulated Area'],
+        vertical_spacing=0.12
+    )
+
+    # Original function
+    fig.add_trace(
+        go.Scatter(x=result["x"], y=result["f"], mode='lines', name='f(t)', line=dict(color='blue', width=3)),
+        row=1, col=1
+    )
+
+    # Integral function (accumulated area)
+    fig.add_trace(
+        go.Scatter(x=result["x"], y=result["F"], mode='lines', name='F(x) = ∫f(t)dt', line=dict(color='red', width=3)),
+        row=2, col=1
+    )
+
+    fig.update_layout(height=600, title_text=f"f(t) = {label}")
+    return fig
+
+
+def ftc_part2_figure(result, func_choice, a, b):
+    """FTC Part 2 graph with the shaded area between a and b."""
+    fig = go.Figure()
+
+    # Function curve
+    fig.add_trace(go.Scatter(
+        x=result["x"], y=result["y"],
+        mode='lines',
+        name=f'f(x) = {func_choice}',
+        line=dict(color='blue', width=3)
+    ))
+
+    # Shaded area
+    fig.add_trace(go.Scatter(
+        x=np.concatenate([result["x_fill"], [b, a]]),
+        y=np.concatenate([result["y_fill"], [0, 0]]),
+        fill='toself',
+        fillcolor='rgba(255, 0, 0, 0.3)',
+        mode='lines',
+        name=f'Area = {result["integral"]:.3f}',
+        line=dict(color='red', width=2)
+    ))
+
+    # Vertical lines at bounds
+    fig.add_vline(x=a, line_dash="dash", line_color="green", annotation_text=f"x = {a}")
+    fig.add_vline(x=b, line_dash="dash", line_color="green", annotation_text=f"x = {b}")
+
+    fig.update_layout(
+        title=f"Definite Integral: ∫[{a:.1f} to {b:.1f}] {func_choice} dx = {result['integral']:.3f}",
+        xaxis_title="x",
+        yaxis_title="f(x)",
+        height=500
+    )
+    return fig
+
+
+def mvt_figure(result, a, b, show_secant, show_tangent):
+    """MVT graph with endpoints, every point c and optional secant/tangent lines."""
+    c = result["c"]
+    avg_rate = result["avg_rate"]
+
+    fig = go.Figure()
+
+    # Main function
+    fig.add_trace(go.Scatter(
+        x=result["x"], y=result["y"],
+        mode='lines',
+        name=result["title"],
+        line=dict(color='blue', width=3)
+    ))
+
+    # Points at a and b
+    fig.add_trace(go.Scatter(
+        x=[a, b],
+        y=[result["f_a"], result["f_b"]],
+        mode='markers',
+        name='Endpoints',
+        marker=dict(color='red', size=8)
+    ))
+
+    # Points c (every root of f'(x) = average rate)
+    c_values, f_c_values = result["c_values"], result["f_c_values"]
+    if c is not None:
+        fig.add_trace(go.Scatter(
+            x=c_values,
+            y=f_c_values,
+            mode='markers',
+            name="MVT point c = " + ", ".join(f"{c_val:.3f}" for c_val in c_values),
+            marker=dict(color='green', size=10, symbol='star')
+        ))
+
+    # Secant line
+    if show_secant:
+        secant_x = np.array([a - 0.5, b + 0.5])
+        secant_y = result["f_a"] + avg_rate * (secant_x - a)
+        fig.add_trace(go.Scatter(
+            x=secant_x, y=secant_y,
+            mode='lines',
+            name=f'Secant line (slope = {avg_rate:.3f})',
+            line=dict(color='red', width=2, dash='dash')
+        ))
+
+    # Tangent lines at each c, one trace separated by NaN
+    if show_tangent and c is not None:
+        tangent_slope = result["f_prime_c"]
+        offsets = np.array([-1.0, 1.0, np.nan])
+        tangent_x = (c_values[:, None] + offsets).ravel()
+        tangent_y = (f_c_values[:, None] + tangent_slope * offsets).ravel()
+        fig.add_trace(go.Scatter(
+            x=tangent_x, y=tangent_y,
+            mode='lines',
+            name=f'Tangent at c (slope = {tangent_slope:.3f})',
+            line=dict(color='green', width=2, dash='dot')
+        ))
+
+    fig.update_layout(
+        title=f"Mean Value Theorem: {result['title']}",
+        xaxis_title="x",
+        yaxis_title="f(x)",
+        height=500,
+        showlegend=True
+    )
+    return fig
+
+
+def riemann_figure(result, riemann_func, method, n_rectangles):
+    """Riemann sum graph with all rectangles packed into one filled trace."""
+    fig = go.Figure()
+
+    # Original function
+    fig.add_trace(go.Scatter(
+        x=result["x"], y=result["y"],
+        mode='lines',
+        name=f'f(x) = {riemann_func}',
+        line=dict(color='blue', width=3)
+    ))
+
+    # Riemann rectangles
+    x_outline, y_outline = riemann.bar_outline(*result["bars"])
+    name = "Rectangles" if result["group"] == 1 else f"Rectangles (each bar = {result['group']})"
+    fig.add_trace(go.Scatter(
+        x=x_outline, y=y_outline,
+        fill='toself',
+        fillcolor="rgba(255, 0, 0, 0.3)",
+        mode='lines',
+        name=name,
+        line=dict(color="red", width=1 if len(result["bars"][0]) <= 100 else 0)
+    ))
+
+    _show_poles(fig, result)
+
+    fig.update_layout(
+        title=f"Riemann Sum ({method}): {result['sum']:.4f} with {n_rectangles} rectangles",
+        xaxis_title="x",
+        yaxis_title="f(x)",
+        height=400
+    )
+    return fig
+
+
+def riemann_convergence_figure(study, riemann_func):
+    """Log-log error-vs-n curves of every summation rule, labelled with the observed order."""
+    fig = go.Figure()
+    for method, errors in study["errors"].items():
+        order = study["orders"][method]
+        label = f"{method} (order ≈ {order:.2f})" if order is not None else f"{method} (exact to round-off)"
+        fig.add_trace(go.Scatter(
+            x=study["n"],
+            # Zero errors have no place on a log axis
+            y=np.where(errors > 0, errors, np.nan),
+            mode='lines+markers',
+            name=label
+        ))
+
+    fig.update_layout(
+        title=f"Convergence of ∫ {riemann_func} dx: error vs number of subintervals",
+        xaxis_title="n",
+        yaxis_title="|approximation − exact|",
+        height=500
+    )
+    fig.update_xaxes(type="log")
+    fig.update_yaxes(type="log", exponentformat="power")
+    return fig
@@ -0,0 +1,37 @@
+"""Deferred module imports for a fast cold start.
+
+SymPy, SciPy and Plotly together take well over a second to import, and
+the Overview page needs none of them. ``lazy_import`` returns a stand-in
+right away and runs the real import on first attribute access, so each
+heavy dependency is paid for by the first section that uses it.
+"""
+import importlib
+
+
+class LazyModule:
+    """Proxy for the module ``name`` that imports it on first attribute access.
+
+    Not a real module and never placed in ``sys.modules``: Streamlit walks
+    ``sys.modules`` (via ``inspect.getmodule``) on every call, which would
+    trigger an ``importlib.util.LazyLoader`` module immediately.
+    """
+
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name):
+    """``LazyModule`` for ``name``; the import happens on first use."""
+    return LazyModule(name)
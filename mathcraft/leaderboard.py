@@ -0,0 +1,100 @@
+"""Live Quiz Mode leaderboard shared by every session in the server process.
+
+Each session's current score is one entry in one of ``shards`` dicts, each
+with its own lock, so concurrent submitters only contend when their
+session ids hash to the same shard, and then only for a dict assignment.
+Readers never touch the shards directly: they get a ranked snapshot that
+is rebuilt at most once per ``ttl`` seconds, by whichever reader finds it
+stale first, while the others keep the previous one.
+"""
+import threading
+import time
+
+DEFAULT_SHARDS = 16
+DEFAULT_TTL = 2.0
+# Sessions silent for longer than this drop off the board
+DEFAULT_MAX_AGE = 3 * 60 * 60
+
+
+class _Shard:
+    __slots__ = ("lock", "entries")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}  # session -> (name, score, answered, updated)
+
+
+class Leaderboard:
+    """Sharded ``session -> score`` map with a TTL-cached ranking."""
+
+    def __init__(self, shards=DEFAULT_SHARDS, ttl=DEFAULT_TTL, max_age=DEFAULT_MAX_AGE):
+        self.ttl = ttl
+        self.max_age = max_age
+        self._shards = [_Shard() for _ in range(shards)]
+        self._rebuild = threading.Lock()
+        self._snapshot = None
+        self._built_at = float("-inf")
+        self.updates = 0
+        self.rebuilds = 0
+
+    def update(self, session, name, score, answered):
+        """Set the current ``score`` out of ``answered`` questions for ``session``, shown as ``name``."""
+        shard = self._shards[hash(session) % len(self._shards)]
+        with shard.lock:
+            shard.entries[session] = (name, score, answered, time.time())
+        self.updates += 1  # approximate under contention; only reported in stats()
+
+    def remove(self, session):
+        shard = self._shards[hash(session) % len(self._shards)]
+        with shard.lock:
+            shard.entries.pop(session, None)
+
+    def _build(self):
+        cutoff = time.time() - self.max_age
+        rows = []
+        for shard in self._shards:
+            with shard.lock:
+                stale = [session for session, entry in shard.entries.items() if entry[3] < cutoff]
+                for session in stale:
+                    del shard.entries[session]
+                rows.extend((session, *entry) for session, entry in shard.entries.items())
+        # Highest score first; ties go to fewer questions used, then to who got there first
+        rows.sort(key=lambda row: (-row[2], row[3], row[4]))
+        ranking = [{"rank": rank, "session": session, "name": name, "score": score, "answered": answered}
+                   for rank, (session, name, score, answered, _) in enumerate(rows, start=1)]
+        return ranking, {row["session"]: row for row in ranking}
+
+    def _current(self):
+        """``(ranking, rows by session)`` as of at most ``ttl`` seconds ago."""
+        now = time.monotonic()
+        if now - self._built_at > self.ttl and self._rebuild.acquire(blocking=self._snapshot is None):
+            try:
+                if time.monotonic() - self._built_at > self.ttl:  # not rebuilt while we waited
+                    self._snapshot = self._build()
+                    self._built_at = time.monotonic()
+                    self.rebuilds += 1
+            finally:
+                self._rebuild.release()
+        return self._snapshot
+
+    def snapshot(self):
+        """The ranking as of at most ``ttl`` seconds ago: dicts with ``rank``, ``name``, ``score``, ``answered``."""
+        return self._current()[0]
+
+    def top(self, limit=10, session=None):
+        """``(leaders, own_row)``: the first ``limit`` rows and ``session``'s own row (or ``None``)."""
+        ranking, by_session = self._current()
+        return ranking[:limit], by_session.get(session)
+
+    def stats(self):
+        return {
+            "shards": len(self._shards),
+            "ttl": self.ttl,
+            "participants": sum(len(shard.entries) for shard in self._shards),
+            "updates": self.updates,
+            "rebuilds": self.rebuilds,
+        }
+
+
+# Shared by every session in the server process
+leaderboard = Leaderboard()
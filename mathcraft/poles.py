@@ -0,0 +1,151 @@
+"""Exact pole locations and pole-free plotting segments.
+
+Instead of hiding poles behind magic thresholds (``|den| > 1e-10``,
+``|y| < 100``), the real roots of a function's denominator are computed
+once per function and the plotting domain is split at them. Each segment
+is sampled on its own and segments are joined with a NaN so Plotly never
+draws a connector across an asymptote.
+"""
+import functools
+
+import numpy as np
+import sympy as sp
+
+from mathcraft.expressions import compile_expression, x
+from mathcraft.sampling import DEFAULT_BUDGET, adaptive_sample, evaluate, evaluate_callable
+
+# Half-width of the gap left around each pole, as a fraction of the x span
+POLE_GAP = 1e-4
+
+
+@functools.lru_cache(maxsize=256)
+def polynomial_real_roots(coeffs):
+    """Sorted distinct real roots of a polynomial given as a descending coefficient tuple."""
+    coeffs = np.trim_zeros(np.asarray(coeffs, dtype=float), 'f')
+    if coeffs.size < 2:
+        return ()
+    roots = np.roots(coeffs)
+    real = np.sort(roots.real[np.abs(roots.imag) <= 1e-9 * np.maximum(1.0, np.abs(roots))])
+    if real.size == 0:
+        return ()
+    # Repeated roots come back from np.roots as a tight cluster
+    distinct = real[np.concatenate([[True], np.diff(real) > 1e-7 * np.maximum(1.0, np.abs(real[1:]))])]
+    return tuple(distinct.tolist())
+
+
+def rational_singularities(numerator, denominator):
+    """``(poles, holes)`` of ``numerator / denominator`` for two ``Polynomial``s.
+
+    Denominator roots where the numerator also vanishes are removable holes.
+    """
+    scale = max(np.abs(numerator.coeffs).max(), 1.0)
+    poles, holes = [], []
+    for root in polynomial_real_roots(denominator.key()):
+        if abs(numerator(root)) <= 1e-9 * scale * max(1.0, abs(root)) ** numerator.degree:
+            holes.append(root)
+        else:
+            poles.append(root)
+    return poles, holes
+
+
+@functools.lru_cache(maxsize=256)
+def expression_singularities(expr):
+    """``(poles, holes)`` of a SymPy expression in ``x``, or ``None`` if unknown.
+
+    Only rational functions of ``x`` are handled exactly; anything else
+    (``tan(x)``, ``sin(x)/x``) returns ``None`` and is plotted with the
+    adaptive sampler alone.
+    """
+    if not expr.is_rational_function(x):
+        return None
+    _, den = sp.fraction(sp.together(expr))
+    _, reduced_den = sp.fraction(sp.cancel(sp.together(expr)))
+    try:
+        all_roots = {float(r) for r in sp.Poly(den, x).real_roots()}
+        pole_roots = {float(r) for r in sp.Poly(reduced_den, x).real_roots()}
+    except (sp.PolynomialError, NotImplementedError):
+        return None
+    return tuple(sorted(pole_roots)), tuple(sorted(all_roots - pole_roots))
+
+
+def pole_segments(singular_points, x_min, x_max):
+    """Split [x_min, x_max] into intervals that stop just short of each singular point."""
+    gap = abs(x_max - x_min) * POLE_GAP
+    inside = sorted(p for p in singular_points if x_min < p < x_max)
+    edges = [x_min] + [edge for p in inside for edge in (p - gap, p + gap)] + [x_max]
+    return [(lo, hi) for lo, hi in zip(edges[::2], edges[1::2]) if hi > lo]
+
+
+def _view_range(func, segments, span):
+    """A y-axis range that shows every segment's shape without chasing the poles.
+
+    Uses the 2nd-98th percentile of a uniform grid (so the steep ends next to
+    a pole, which cover a tiny share of the x span, are left out).
+    """
+    y_vals = np.concatenate([
+        evaluate_callable(func, np.linspace(lo, hi, max(int(400 * (hi - lo) / span), 2)))
+        for lo, hi in segments
+    ])
+    y_vals = y_vals[np.isfinite(y_vals)]
+    if y_vals.size < 2:
+        return None
+    low, high = np.percentile(y_vals, [2, 98])
+    pad = 0.1 * max(high - low, 1.0)
+    return [float(low - pad), float(high + pad)]
+
+
+def segmented_sample(func, x_min, x_max, singular_points, budget=DEFAULT_BUDGET):
+    """Sample ``func`` on each pole-free segment of [x_min, x_max].
+
+    Returns ``(x, y, y_range)``: segments are joined by a single NaN at the
+    pole, and ``y_range`` is a suggested axis range (``None`` when there is
+    no pole in view and Plotly's autoscale is fine).
+    """
+    x_min, x_max = min(x_min, x_max), max(x_min, x_max)
+    segments = pole_segments(singular_points, x_min, x_max) or [(x_min, x_max)]
+    span = (x_max - x_min) or 1.0
+    y_range = _view_range(func, segments, span) if len(segments) > 1 else None
+
+    # Every segment gets a floor share so short ones between close poles still
+    # get a shape; the rest of the budget is split by length
+    floor = max(budget // (4 * len(segments)), 9)
+    spare = max(budget - floor * len(segments), 0)
+
+    x_parts, y_parts = [], []
+    for lo, hi in segments:
+        if x_parts:
+            x_parts.append([(x_parts[-1][-1] + lo) / 2])
+            y_parts.append([np.nan])
+        share = floor + int(spare * (hi - lo) / span)
+        x_seg, y_seg = adaptive_sample(func, lo, hi, share, view=y_range)
+        x_parts.append(x_seg)
+        y_parts.append(y_seg)
+
+    return np.concatenate(x_parts), np.concatenate(y_parts), y_range
+
+
+def sample_expression(text, x_min, x_max, budget=DEFAULT_BUDGET, fallback_clip=None):
+    """Pole-aware samples of the expression ``text`` over [x_min, x_max].
+
+    Returns a dict with ``x``, ``y``, the true ``poles`` in range and a
+    suggested ``y_range``. Expressions whose poles cannot be found exactly
+    are sampled adaptively in one piece, clipped at ``fallback_clip``.
+    """
+    compiled = compile_expression(text)
+
+    def func(v):
+        return evaluate(compiled, v)
+
+    singularities = expression_singularities(compiled.expr)
+    if singularities is None:
+        x_vals, y_vals = adaptive_sample(func, x_min, x_max, budget, clip=fallback_clip)
+        return {"x": x_vals, "y": y_vals, "poles": [], "y_range": None}
+
+    poles, holes = singularities
+    x_vals, y_vals, y_range = segmented_sample(func, x_min, x_max, poles + holes, budget)
+    return {
+        "x": x_vals,
+        "y": y_vals,
+        "poles": [p for p in poles if x_min < p < x_max],
+        "y_range": y_range,
+    }
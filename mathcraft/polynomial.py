@@ -0,0 +1,91 @@
+"""Dense coefficient-array polynomials.
+
+The Function Builder collects terms as ``(coefficient, power)`` pairs; they
+are merged into one NumPy array so a whole curve is a single Horner pass
+(``numpy.polyval``) no matter how many terms were entered. Long division
+(``polynomial_division``) gives the slant or polynomial asymptote of a
+rational function.
+"""
+import functools
+
+import numpy as np
+
+_SUPERSCRIPTS = str.maketrans("0123456789", "⁰¹²³⁴⁵⁶⁷⁸⁹")
+
+
+class Polynomial:
+    """Polynomial with float coefficients in descending powers (``numpy.polyval`` order).
+
+    Leading zeros are trimmed, so ``degree`` and ``leading`` are always the
+    true degree and leading coefficient; the zero polynomial is ``[0.0]``.
+    """
+
+    __slots__ = ("coeffs",)
+
+    def __init__(self, coeffs):
+        coeffs = np.trim_zeros(np.atleast_1d(np.asarray(coeffs, dtype=float)), 'f')
+        self.coeffs = coeffs if coeffs.size else np.zeros(1)
+
+    @classmethod
+    def from_terms(cls, coeffs, powers):
+        """Build from parallel coefficient/power lists, summing duplicate powers."""
+        powers = np.asarray(powers, dtype=int)
+        if powers.size == 0:
+            return cls([0.0])
+        dense = np.zeros(powers.max() + 1)
+        np.add.at(dense, powers.max() - powers, np.asarray(coeffs, dtype=float))
+        return cls(dense)
+
+    @property
+    def degree(self):
+        return len(self.coeffs) - 1
+
+    @property
+    def leading(self):
+        return self.coeffs[0]
+
+    @property
+    def is_zero(self):
+        return self.degree == 0 and self.coeffs[0] == 0
+
+    def key(self):
+        """Hashable form of the coefficients, for use as a cache key."""
+        return tuple(self.coeffs.tolist())
+
+    def __call__(self, x_vals):
+        """Evaluate at a scalar or array with Horner's scheme."""
+        return np.polyval(self.coeffs, x_vals)
+
+    def format(self, digits=4):
+        """Textbook form such as ``2x² - 0.5x + 1``, coefficients to ``digits`` significant digits."""
+        terms = []
+        for power, coeff in zip(range(self.degree, -1, -1), self.coeffs):
+            if coeff == 0 and (terms or power > 0):
+                continue
+            magnitude = f"{abs(coeff):.{digits}g}"
+            if power > 0:
+                magnitude = ("" if magnitude == "1" else magnitude) + "x" + (
+                    str(power).translate(_SUPERSCRIPTS) if power > 1 else "")
+            sign = "-" if coeff < 0 else "+"
+            terms.append(f"{sign} {magnitude}" if terms else ("-" if coeff < 0 else "") + magnitude)
+        return " ".join(terms)
+
+    def __repr__(self):
+        return f"Polynomial({self.coeffs.tolist()})"
+
+
+@functools.lru_cache(maxsize=256)
+def polynomial_division(num_key, den_key):
+    """``(quotient, remainder)`` of two descending coefficient tuples, as ``Polynomial``s.
+
+    ``numpy.polydiv`` long division, so ``numerator = quotient * denominator
+    + remainder`` with ``remainder.degree < denominator.degree``; remainder
+    coefficients at rounding level relative to the numerator are dropped, so
+    an exact division leaves the zero polynomial. Results are cached per
+    coefficient pair and shared, so callers must not modify them.
+    """
+    numerator = np.asarray(num_key, dtype=float)
+    quotient, remainder = np.polydiv(numerator, np.asarray(den_key, dtype=float))
+    noise = 1e-12 * max(np.abs(numerator).max(), 1.0)
+    remainder = np.where(np.abs(remainder) <= noise, 0.0, remainder)
+    return Polynomial(quotient), Polynomial(remainder)
@@ -0,0 +1,191 @@
+"""Precomputed Quiz Mode questions, served from a memory-mapped bank.
+
+``mathcraft.quizgen`` generates families of questions offline with SymPy
+(random rational limits, horizontal asymptotes, FTC and MVT problems, each
+with computed distractors) and writes them to one compact file::
+
+    magic  b"MCQB1\\n"
+    uint32 header length, then the JSON header {"families": {name: [start, count]}}
+    uint32 offsets[count + 1], little-endian, into the payload
+    payload: the questions as concatenated compact JSON
+
+The bank is memory-mapped once per server process; a question is found by
+two offset reads and one ``json.loads``, so serving one costs the same for
+any bank size and no SymPy call. Question ids are ``"family/index"``; the
+hand-written concept questions below are always available as
+``"concepts/index"`` and are the whole quiz when no bank file exists.
+"""
+import json
+import mmap
+import os
+import struct
+import threading
+
+MAGIC = b"MCQB1\n"
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "quiz_bank.bin")
+
+# Questions per quiz, by family, in the order they are asked
+QUIZ_PLAN = [
+    "rational_limit", "rational_limit",
+    "horizontal_asymptote", "horizontal_asymptote",
+    "ftc_part1", "ftc_part2",
+    "mvt",
+    "concepts",
+]
+
+CONCEPT_QUESTIONS = [
+    {
+        "question": "What is lim(x→∞) (3x² + 2x + 1)/(x² - 5)?",
+        "options": ["0", "3", "∞", "Does not exist"],
+        "correct": 1,
+        "explanation": "Since both numerator and denominator have degree 2, the limit equals the ratio of leading coefficients: 3/1 = 3"
+    },
+    {
+        "question": "What is lim(x→∞) (2x + 1)/(x² + 3x)?",
+        "options": ["0", "2", "1/3", "∞"],
+        "correct": 0,
+        "explanation": "The denominator has higher degree than numerator, so the limit is 0."
+    },
+    {
+        "question": "According to FTC Part 1, what is d/dx[∫₀ˣ t² dt]?",
+        "options": ["x²", "x³/3", "2x", "0"],
+        "correct": 0,
+        "explanation": "FTC Part 1 states that d/dx[∫ₐˣ f(t) dt] = f(x). Here f(t) = t², so the answer is x²."
+    },
+    {
+        "question": "If f(x) = (x³ + 2x)/(x³ - 1), what is its horizontal asymptote?",
+        "options": ["y = 0", "y = 1", "y = 2", "No horizontal asymptote"],
+        "correct": 1,
+        "explanation": "Both numerator and denominator have degree 3. The ratio of leading coefficients is 1/1 = 1, so y = 1."
+    },
+    {
+        "question": "What does ∫₁³ 2x dx equal using FTC Part 2?",
+        "options": ["8", "6", "4", "10"],
+        "correct": 0,
+        "explanation": "∫2x dx = x² + C. So ∫₁³ 2x dx = [x²]₁³ = 3² - 1² = 9 - 1 = 8."
+    },
+    {
+        "question": "According to the Mean Value Theorem, if f(x) = x² on [1,3], what is f'(c)?",
+        "options": ["2", "4", "6", "8"],
+        "correct": 1,
+        "explanation": "Average rate = (f(3)-f(1))/(3-1) = (9-1)/2 = 4. MVT guarantees f'(c) = 4 for some c in (1,3)."
+    },
+    {
+        "question": "For MVT to apply, a function must be:",
+        "options": ["Continuous on [a,b] only", "Differentiable on (a,b) only", "Both continuous on [a,b] and differentiable on (a,b)", "Neither"],
+        "correct": 2,
+        "explanation": "MVT requires the function to be continuous on the closed interval [a,b] AND differentiable on the open interval (a,b)."
+    }
+]
+
+
+def write_bank(path, families):
+    """Write ``{family: [question, ...]}`` to ``path`` in the bank format, atomically."""
+    header = {"families": {}}
+    records = []
+    for name, questions in families.items():
+        header["families"][name] = [len(records), len(questions)]
+        records.extend(json.dumps(q, ensure_ascii=False, separators=(",", ":")).encode() for q in questions)
+
+    offsets = [0]
+    for record in records:
+        offsets.append(offsets[-1] + len(record))
+    header_bytes = json.dumps(header, separators=(",", ":")).encode()
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header_bytes)))
+        f.write(header_bytes)
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        f.writelines(records)
+    os.replace(tmp, path)
+
+
+class QuestionBank:
+    """Read-only view of a bank file, mapped on first use.
+
+    A missing or malformed file leaves the bank empty: ``families`` is
+    ``{}`` and only the concept questions are served.
+    """
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._map = None
+        self._families = None
+        self._offsets = 0   # byte position of offsets[0]
+        self._payload = 0   # byte position of the payload
+
+    def _open(self):
+        with self._lock:
+            if self._families is not None:
+                return
+            families = {}
+            try:
+                with open(self.path, "rb") as f:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if mapped[:len(MAGIC)] != MAGIC:
+                    raise ValueError("not a question bank")
+                (header_size,) = struct.unpack_from("<I", mapped, len(MAGIC))
+                start = len(MAGIC) + 4
+                families = json.loads(mapped[start:start + header_size])["families"]
+                total = sum(count for _, count in families.values())
+                self._offsets = start + header_size
+                self._payload = self._offsets + 4 * (total + 1)
+                self._map = mapped
+            except (OSError, ValueError, KeyError, struct.error):
+                families = {}
+            self._families = families
+
+    @property
+    def families(self):
+        """``{family: question count}`` for the families in the bank file."""
+        self._open()
+        return {name: count for name, (_, count) in self._families.items()}
+
+    def question(self, family, index):
+        """Question ``index`` of ``family`` as a dict; ``IndexError`` if out of range."""
+        self._open()
+        start, count = self._families[family]
+        if not 0 <= index < count:
+            raise IndexError(f"{family} has {count} questions")
+        lo, hi = struct.unpack_from("<2I", self._map, self._offsets + 4 * (start + index))
+        return json.loads(self._map[self._payload + lo:self._payload + hi])
+
+
+# Shared by every session in the server process
+quiz_bank = QuestionBank()
+
+
+def get_question(question_id):
+    """The question for a ``"family/index"`` id from ``draw_quiz``."""
+    family, index = question_id.rsplit("/", 1)
+    if family == "concepts":
+        return CONCEPT_QUESTIONS[int(index)]
+    return quiz_bank.question(family, int(index))
+
+
+def draw_quiz(rng):
+    """Question ids for one quiz following ``QUIZ_PLAN``, drawn with ``rng`` (a ``random.Random``).
+
+    Families missing from the bank are left out; without a bank the quiz
+    is the concept questions in order.
+    """
+    available = quiz_bank.families
+    if not available:
+        return [f"concepts/{i}" for i in range(len(CONCEPT_QUESTIONS))]
+    available["concepts"] = len(CONCEPT_QUESTIONS)
+
+    ids = []
+    for family in QUIZ_PLAN:
+        count = available.get(family, 0)
+        if not count:
+            continue
+        # Redraw a repeat; families are far larger than their share of a quiz
+        question_id = f"{family}/{rng.randrange(count)}"
+        while question_id in ids and count > QUIZ_PLAN.count(family):
+            question_id = f"{family}/{rng.randrange(count)}"
+        ids.append(question_id)
+    return ids
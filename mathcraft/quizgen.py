@@ -0,0 +1,275 @@
+"""Offline generator for the Quiz Mode question bank.
+
+Every family draws random integer-coefficient problems, computes the
+correct answer with SymPy and builds distractors from the usual mistakes
+(inverted coefficient ratios, F(b) + F(a), the secant slope given as c,
+...). The result is written with ``quizbank.write_bank``::
+
+    python -m mathcraft.quizgen --per-family 300 --seed 0
+
+The app only reads the bank, so SymPy is never called to serve a question.
+"""
+import argparse
+import functools
+import random
+import re
+import sys
+import time
+
+import sympy as sp
+
+from mathcraft.expressions import x
+from mathcraft.polynomial import Polynomial
+from mathcraft.quizbank import DEFAULT_PATH, write_bank
+
+t = sp.Symbol('t')
+
+_SUPERSCRIPTS = {"**2": "²", "**3": "³", "**4": "⁴"}
+_SUBSCRIPT_DIGITS = str.maketrans("0123456789-", "₀₁₂₃₄₅₆₇₈₉₋")
+_SUPERSCRIPT_DIGITS = str.maketrans("0123456789-x", "⁰¹²³⁴⁵⁶⁷⁸⁹⁻ˣ")
+
+
+def show(value):
+    """Textbook text for a SymPy number or expression: ``∞``, ``√3/3``, ``3x² - 2x``, ``eˣ``."""
+    if value is sp.oo:
+        return "∞"
+    if value is -sp.oo:
+        return "-∞"
+    text = str(value).replace("sqrt", "√").replace("exp(x)", "eˣ").replace("exp(t)", "eᵗ").replace("exp(", "e^(")
+    for power, superscript in _SUPERSCRIPTS.items():
+        text = text.replace(power, superscript)
+    text = re.sub(r"(\d)\*(?=[a-z√(])", r"\1", text)  # 3*x -> 3x
+    text = re.sub(r"\bE\b", "e", text)
+    return text.replace("*", "·")
+
+
+def integral_sign(lower, upper):
+    """``∫₋₁³``-style integral sign with the bounds as sub/superscripts."""
+    return f"∫{str(lower).translate(_SUBSCRIPT_DIGITS)}{str(upper).translate(_SUPERSCRIPT_DIGITS)}"
+
+
+def _ratio(p, q):
+    """``p/q`` as written, with a negative ``q`` in parentheses."""
+    return f"{p}/{q}" if q > 0 else f"{p}/({q})"
+
+
+def _ratio_value(p, q, value):
+    """``p/q = value``, or just ``p/q`` when it already reads as ``value`` (in lowest terms)."""
+    written, reduced = _ratio(p, q), show(value)
+    return written if written == reduced else f"{written} = {reduced}"
+
+
+def _parenthesized(value):
+    """``show(value)``, in parentheses when negative."""
+    return f"({show(value)})" if value < 0 else show(value)
+
+
+def _polynomial(rng, degree, low=-9, high=9):
+    """Integer coefficients, descending, with a non-zero leading term and some zero terms."""
+    coeffs = [rng.choice([c for c in range(low, high + 1) if c != 0])]
+    coeffs += [rng.randint(low, high) if rng.random() < 0.7 else 0 for _ in range(degree)]
+    return coeffs
+
+
+def _text(coeffs):
+    return Polynomial(coeffs).format()
+
+
+def _sympy(coeffs, var=x):
+    return sum(c * var**p for p, c in enumerate(reversed(coeffs)))
+
+
+def _choices(rng, correct, candidates):
+    """``(options, correct_index)``: ``correct`` and three distinct distractors, shuffled.
+
+    Candidates equal to the answer are dropped; ``None`` is returned when
+    fewer than three distractors remain.
+    """
+    distractors = []
+    for candidate in candidates:
+        if candidate != correct and candidate not in distractors:
+            distractors.append(candidate)
+    if len(distractors) < 3:
+        return None
+    options = [correct] + rng.sample(distractors, 3)
+    rng.shuffle(options)
+    return options, options.index(correct)
+
+
+def _question(text, choices, explanation):
+    if choices is None:
+        return None
+    options, correct = choices
+    return {"question": text, "options": options, "correct": correct, "explanation": explanation}
+
+
+def _rational(rng):
+    num = _polynomial(rng, rng.randint(0, 3))
+    den = _polynomial(rng, rng.randint(1, 3))
+    ratio = sp.Rational(num[0], den[0])
+    const_ratio = sp.Rational(num[-1], den[-1]) if den[-1] else sp.Integer(num[-1])
+    return num, den, ratio, const_ratio
+
+
+def rational_limit(rng):
+    num, den, ratio, const_ratio = _rational(rng)
+    limit = sp.limit(_sympy(num) / _sympy(den), x, sp.oo)
+    gap = len(num) - len(den)
+    if gap < 0:
+        reason = "The denominator has higher degree than the numerator, so the limit is 0."
+    elif gap == 0:
+        reason = (f"Both numerator and denominator have degree {len(num) - 1}, so the limit is the "
+                  f"ratio of leading coefficients: {_ratio_value(num[0], den[0], limit)}.")
+    else:
+        reason = (f"The numerator has higher degree, so f(x) grows without bound; the sign of "
+                  f"{_ratio(num[0], den[0])} gives {show(limit)}.")
+    return _question(
+        f"What is lim(x→∞) ({_text(num)})/({_text(den)})?",
+        _choices(rng, show(limit), [show(v) for v in (0, ratio, 1 / ratio, sp.oo, -sp.oo, const_ratio)]
+                 + ["Does not exist"]),
+        reason,
+    )
+
+
+def horizontal_asymptote(rng):
+    num, den, ratio, const_ratio = _rational(rng)
+    limit = sp.limit(_sympy(num) / _sympy(den), x, sp.oo)
+    gap = len(num) - len(den)
+    correct = "No horizontal asymptote" if gap > 0 else f"y = {show(limit)}"
+    if gap < 0:
+        reason = "The denominator has higher degree, so the horizontal asymptote is y = 0."
+    elif gap == 0:
+        reason = (f"The degrees are equal, so the asymptote is the ratio of leading coefficients: "
+                  f"y = {_ratio_value(num[0], den[0], limit)}.")
+    else:
+        reason = "The numerator has higher degree, so there is no horizontal asymptote."
+    return _question(
+        f"If f(x) = ({_text(num)})/({_text(den)}), what is its horizontal asymptote?",
+        _choices(rng, correct, [f"y = {show(v)}" for v in (0, ratio, 1 / ratio, 1, const_ratio)]
+                 + ["No horizontal asymptote"]),
+        reason,
+    )
+
+
+def _integrand(rng):
+    k = rng.randint(2, 4)
+    c = rng.choice([c for c in range(-5, 6) if c != 0])
+    return rng.choice([
+        c * t**rng.randint(1, 3) + rng.randint(-5, 5),
+        sp.sin(k * t),
+        sp.cos(k * t),
+        sp.exp(k * t),
+        1 / (1 + t**2),
+        t * sp.exp(t),
+    ])
+
+
+@functools.lru_cache(maxsize=None)
+def _accumulation(f, a):
+    """∫ₐˣ f(t) dt; the integrand pool is small, so draws repeat often."""
+    return sp.integrate(f, (t, a, x))
+
+
+def ftc_part1(rng):
+    f = _integrand(rng)
+    a = rng.randint(0, 3)
+    antiderivative = _accumulation(f, a)
+    fx = f.subs(t, x)
+    integrand = f"({show(f)})" if f.is_Add else show(f)
+    candidates = [antiderivative, sp.diff(fx, x), fx - f.subs(t, a), fx * x, sp.Integer(0)]
+    return _question(
+        f"According to FTC Part 1, what is d/dx[{integral_sign(a, 'x')} {integrand} dt]?",
+        _choices(rng, show(fx), [show(v) for v in candidates]),
+        f"FTC Part 1 states that d/dx[∫ₐˣ f(t) dt] = f(x) for any lower bound a. "
+        f"Here f(t) = {show(f)}, so the answer is {show(fx)}.",
+    )
+
+
+def ftc_part2(rng):
+    coeffs = _polynomial(rng, rng.randint(1, 2), -6, 6)
+    a = rng.randint(-3, 2)
+    b = rng.randint(a + 1, 4)
+    p = _sympy(coeffs)
+    F = sp.integrate(p, x)
+    value = F.subs(x, b) - F.subs(x, a)
+    candidates = [F.subs(x, b) + F.subs(x, a), F.subs(x, b), p.subs(x, b) - p.subs(x, a),
+                  (b - a) * p.subs(x, b), value + 1, value - 1, -value]
+    return _question(
+        f"What does {integral_sign(a, b)} ({_text(coeffs)}) dx equal using FTC Part 2?",
+        _choices(rng, show(value), [show(v) for v in candidates]),
+        f"An antiderivative is F(x) = {show(F)}, so the integral is F({b}) - F({a}) = "
+        f"{show(F.subs(x, b))} - {_parenthesized(F.subs(x, a))} = {show(value)}.",
+    )
+
+
+def mvt(rng):
+    coeffs = _polynomial(rng, rng.randint(2, 3), -4, 4)
+    a = rng.randint(-3, 1)
+    b = rng.randint(a + 1, 3)
+    f = _sympy(coeffs)
+    slope = (f.subs(x, b) - f.subs(x, a)) / (b - a)
+    solutions = [c for c in sp.solve(sp.Eq(sp.diff(f, x), slope), x)
+                 if c.is_real and a < c < b]
+    if not solutions:
+        return None
+    c = rng.choice(solutions)
+
+    def satisfies(value):
+        return sp.simplify(sp.diff(f, x).subs(x, value) - slope) == 0
+
+    candidates = [v for v in (sp.Integer(a), sp.Integer(b), slope, sp.Rational(a + b, 2), -c, c + 1, c - 1)
+                  if not satisfies(v)]
+    return _question(
+        f"For f(x) = {_text(coeffs)} on [{a}, {b}], which value of c satisfies the Mean Value Theorem?",
+        _choices(rng, show(c), [show(v) for v in candidates]),
+        f"The average rate of change is (f({b}) - f({a}))/({b - a}) = {show(slope)}. "
+        f"With f'(x) = {show(sp.diff(f, x))}, solving f'(c) = {show(slope)} in ({a}, {b}) gives c = {show(c)}.",
+    )
+
+
+FAMILIES = {
+    "rational_limit": rational_limit,
+    "horizontal_asymptote": horizontal_asymptote,
+    "ftc_part1": ftc_part1,
+    "ftc_part2": ftc_part2,
+    "mvt": mvt,
+}
+
+
+def generate(family, count, rng, max_attempts=50):
+    """``count`` distinct questions of ``family``, or fewer if it runs out of new ones."""
+    make = FAMILIES[family]
+    questions, seen = [], set()
+    for _ in range(count * max_attempts):
+        if len(questions) == count:
+            break
+        question = make(rng)
+        if question is None or question["question"] in seen:
+            continue
+        seen.add(question["question"])
+        questions.append(question)
+    return questions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--per-family", type=int, default=300, help="questions per family")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (the bank is reproducible)")
+    parser.add_argument("-o", "--output", default=DEFAULT_PATH, help="bank file to write")
+    parser.add_argument("--family", action="append", choices=list(FAMILIES),
+                        help="only these families (repeatable); default all")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    families = {}
+    for family in args.family or FAMILIES:
+        start = time.perf_counter()
+        families[family] = generate(family, args.per_family, rng)
+        print(f"{family:<22}{len(families[family]):>6} questions in {time.perf_counter() - start:.1f} s",
+              file=sys.stderr)
+    write_bank(args.output, families)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""All real roots of a vectorized function on an interval.
+
+A uniform grid is evaluated in one NumPy call; every sign change between
+neighbours brackets a root that ``scipy.optimize.brentq`` then refines.
+Roots where the function only touches zero (no sign change) show up as
+small local minima of ``|g|`` and are refined by bounded minimization.
+"""
+import numpy as np
+
+from mathcraft.sampling import evaluate_callable
+
+# Grid points per interval; roots closer together than a grid step may merge
+DEFAULT_GRID = 1024
+
+
+def _dedupe(roots, tol):
+    roots = np.sort(np.asarray(roots, dtype=float))
+    if roots.size == 0:
+        return roots
+    return roots[np.concatenate([[True], np.diff(roots) > tol])]
+
+
+def find_roots(g, a, b, grid=DEFAULT_GRID, xtol=1e-12):
+    """Sorted roots of the vectorized ``g`` strictly inside (a, b).
+
+    Points where ``g`` is undefined (NaN) never bracket a root.
+    """
+    from scipy.optimize import brentq, minimize_scalar  # ~150 ms; only the MVT Explorer needs it
+
+    x_vals = np.linspace(a, b, grid + 1)
+    g_vals = evaluate_callable(g, x_vals)
+    scale = max(np.nanmax(np.abs(g_vals)), 1.0) if np.isfinite(g_vals).any() else 1.0
+
+    def scalar(v):
+        return float(g(v))
+
+    roots = list(x_vals[1:-1][g_vals[1:-1] == 0])
+
+    # Sign changes between defined neighbours
+    with np.errstate(invalid='ignore'):
+        brackets = np.flatnonzero(g_vals[:-1] * g_vals[1:] < 0)
+    for i in brackets:
+        roots.append(brentq(scalar, x_vals[i], x_vals[i + 1], xtol=xtol))
+
+    # Touching roots: local minima of |g| with no sign change around them
+    magnitude = np.abs(g_vals)
+    with np.errstate(invalid='ignore'):
+        dips = np.flatnonzero(
+            (magnitude[1:-1] <= magnitude[:-2]) & (magnitude[1:-1] <= magnitude[2:])
+            & (g_vals[:-2] * g_vals[2:] > 0)
+        ) + 1
+    for i in dips:
+        found = minimize_scalar(lambda v: abs(scalar(v)), bounds=(x_vals[i - 1], x_vals[i + 1]),
+                                method='bounded', options={'xatol': xtol})
+        if abs(found.fun) <= 1e-9 * scale:
+            roots.append(found.x)
+
+    roots = _dedupe(roots, 1e-9 * max(abs(b - a), 1.0))
+    return roots[(roots > a) & (roots < b)]
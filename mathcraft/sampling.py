@@ -0,0 +1,139 @@
+"""Vectorized, adaptive sampling of functions for plotting.
+
+Curves are evaluated in one NumPy call through the lambdified form from
+``mathcraft.expressions``. Poles and clipped values become NaN so Plotly
+breaks the line there instead of drawing a vertical connector.
+
+``adaptive_sample`` places a fixed budget of points where the curve bends
+or leaves its domain, and only a coarse grid on smooth stretches.
+"""
+import numpy as np
+
+from mathcraft.expressions import x
+
+
+def _to_real(values, shape):
+    """Coerce a lambdified result to a float array of ``shape``; complex values become NaN."""
+    values = np.asarray(values)
+    if np.iscomplexobj(values):
+        values = np.where(np.abs(values.imag) < 1e-12, values.real, np.nan)
+    return np.broadcast_to(values.astype(float), shape).copy()
+
+
+def _evaluate_symbolic(expr, x_vals):
+    """Per-point ``subs`` fallback for expressions that cannot be lambdified."""
+    y_vals = np.empty(len(x_vals))
+    for i, x_val in enumerate(x_vals):
+        try:
+            y_vals[i] = float(expr.subs(x, x_val))
+        except (TypeError, ValueError, ZeroDivisionError):
+            y_vals[i] = np.nan
+    return y_vals
+
+
+def evaluate(compiled, x_vals, clip=None):
+    """Evaluate a ``CompiledExpression`` on ``x_vals`` in one vectorized pass.
+
+    Non-finite values (poles, domain errors) and values with ``|y| >= clip``
+    are returned as NaN.
+    """
+    x_vals = np.asarray(x_vals, dtype=float)
+    y_vals = None
+    if compiled.func is not None:
+        try:
+            with np.errstate(all='ignore'):
+                y_vals = _to_real(compiled.func(x_vals), x_vals.shape)
+        except (TypeError, ValueError, ZeroDivisionError, NameError, AttributeError):
+            y_vals = None
+    if y_vals is None:
+        y_vals = _evaluate_symbolic(compiled.expr, x_vals)
+
+    mask = ~np.isfinite(y_vals)
+    if clip is not None:
+        with np.errstate(invalid='ignore'):
+            mask |= np.abs(y_vals) >= clip
+    y_vals[mask] = np.nan
+    return y_vals
+
+
+# Points per plotted curve; a coarse pass uses 1/8 of it, refinement the rest
+DEFAULT_BUDGET = 400
+
+
+def evaluate_callable(func, x_vals, clip=None):
+    """Evaluate a vectorized ``func`` as a float array, masking non-finite and clipped values as NaN."""
+    with np.errstate(all='ignore'):
+        y_vals = _to_real(func(x_vals), x_vals.shape)
+        y_vals[~np.isfinite(y_vals)] = np.nan
+        if clip is not None:
+            y_vals[np.abs(y_vals) >= clip] = np.nan
+    return y_vals
+
+
+def _y_scale(y_vals):
+    """Robust vertical extent of a curve, used to make tolerances scale-free."""
+    finite = y_vals[np.isfinite(y_vals)]
+    if finite.size < 2:
+        return 1.0
+    low, high = np.percentile(finite, [2, 98])
+    return high - low if high > low else max(abs(high), 1.0)
+
+
+def _interval_error(y_vals, y_mid, scale):
+    """Scaled deviation of each interval's midpoint from the chord between its ends.
+
+    Intervals where only some of the three samples are defined straddle a
+    pole or domain boundary and get infinite error so they refine first.
+    """
+    y_left, y_right = y_vals[:-1], y_vals[1:]
+    defined = np.isfinite(y_left).astype(int) + np.isfinite(y_right) + np.isfinite(y_mid)
+    with np.errstate(invalid='ignore'):
+        error = np.abs(y_mid - (y_left + y_right) / 2) / scale
+    error[defined == 0] = 0.0
+    error[(defined > 0) & (defined < 3)] = np.inf
+    return error
+
+
+def adaptive_sample(func, x_min, x_max, budget=DEFAULT_BUDGET, clip=None, tol=1e-3, view=None):
+    """Sample a vectorized ``func`` on [x_min, x_max] with at most ``budget`` points.
+
+    Starts from a coarse uniform grid and repeatedly bisects the intervals
+    whose midpoint deviates most from a straight line (relative to the
+    curve's height), so points concentrate near bends, poles and domain
+    edges. Returns ``(x, y)`` with NaN where ``func`` is undefined or
+    ``|y| >= clip``.
+
+    ``view`` is an optional ``[y_low, y_high]`` plot range: the error is then
+    measured on values clamped to it, so no points are spent refining parts
+    of the curve that are off-screen.
+    """
+    x_vals = np.linspace(x_min, x_max, min(budget, max(budget // 8, 9)))
+    y_vals = evaluate_callable(func, x_vals, clip)
+    min_width = abs(x_max - x_min) * 1e-5  # well below one pixel, even zoomed in
+
+    if view is not None:
+        height = view[1] - view[0]
+        bounds = (view[0] - height, view[1] + height)
+
+    while len(x_vals) < budget:
+        x_mid = (x_vals[:-1] + x_vals[1:]) / 2
+        y_mid = evaluate_callable(func, x_mid, clip)
+
+        if view is None:
+            error = _interval_error(y_vals, y_mid, _y_scale(y_vals))
+        else:
+            error = _interval_error(np.clip(y_vals, *bounds), np.clip(y_mid, *bounds), height)
+        error[np.abs(np.diff(x_vals)) <= min_width] = 0.0
+        refine = np.flatnonzero(error > tol)
+        if refine.size == 0:
+            break
+
+        room = budget - len(x_vals)
+        if refine.size > room:
+            refine = np.sort(refine[np.argsort(error[refine])[-room:]])
+
+        x_vals = np.insert(x_vals, refine + 1, x_mid[refine])
+        y_vals = np.insert(y_vals, refine + 1, y_mid[refine])
+
+    return x_vals, y_vals
+
@@ -0,0 +1,162 @@
+"""Persistent SQLite cache of symbolic results.
+
+Limits, denominator zeros and domains depend only on the expression text
+and the SymPy version, so they are kept on disk across sessions and server
+restarts. Rows are keyed by operation, normalized expression and
+arguments; rows written by another SymPy version are dropped when the
+store is opened. When the values outgrow ``max_bytes`` the least recently
+used rows are evicted.
+"""
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+import sympy as sp
+
+# Bump when the stored value format, or what an operation returns, changes
+# (2: denominator zeros are real only)
+_FORMAT = 2
+VERSION = f"sympy-{sp.__version__}/format-{_FORMAT}"
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_PATH = os.path.join(
+    os.environ.get("MATHCRAFT_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "mathcraft"),
+    "symbolic.sqlite3",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    version TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+"""
+
+
+class SymbolicStore:
+    """On-disk ``key -> value`` store for picklable SymPy results, bounded by ``max_bytes``.
+
+    Any SQLite error (read-only disk, corrupt file) degrades to a cache
+    miss rather than failing the calculation.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+
+    def _connect(self):
+        """Open (once) and drop rows from other SymPy versions; in-memory if the path is unusable."""
+        if self._conn is None:
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                # WAL: readers never block the writer, and commits skip a full fsync
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(_SCHEMA)
+            except (OSError, sqlite3.Error):
+                conn = sqlite3.connect(":memory:", check_same_thread=False)
+                conn.executescript(_SCHEMA)
+            with conn:
+                conn.execute("DELETE FROM results WHERE version != ?", (VERSION,))
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def make_key(operation, text, args=()):
+        return f"{operation}|{text}|{args!r}"
+
+    def get(self, key):
+        """``(True, value)`` for a stored key, else ``(False, None)``."""
+        with self._lock:
+            try:
+                conn = self._connect()
+                row = conn.execute("SELECT value FROM results WHERE key = ? AND version = ?",
+                                   (key, VERSION)).fetchone()
+                if row is not None:
+                    with conn:
+                        conn.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+                    value = pickle.loads(row[0])
+            except (sqlite3.Error, pickle.UnpicklingError, AttributeError, ImportError, EOFError):
+                self.errors += 1
+                row = None
+            if row is None:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            return True, value
+
+    def put(self, key, value):
+        """Store ``value`` under ``key`` and evict least-recently-used rows past ``max_bytes``."""
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        with self._lock:
+            try:
+                conn = self._connect()
+                with conn:
+                    conn.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                                 (key, VERSION, blob, len(blob), time.time()))
+                    self._evict(conn)
+            except sqlite3.Error:
+                self.errors += 1
+
+    def _evict(self, conn):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Oldest first, until the survivors fit
+        stale = []
+        for key, size in conn.execute("SELECT key, size FROM results ORDER BY last_used"):
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM results WHERE key = ?", stale)
+        self.evictions += len(stale)
+
+    def stats(self):
+        """Rows and bytes stored, plus hit/miss/eviction counters since start-up."""
+        with self._lock:
+            try:
+                rows, size = self._connect().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+            except sqlite3.Error:
+                rows, size = 0, 0
+            lookups = self.hits + self.misses
+            return {
+                "path": self.path,
+                "rows": rows,
+                "bytes": size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "errors": self.errors,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self):
+        with self._lock:
+            try:
+                with self._connect() as conn:
+                    conn.execute("DELETE FROM results")
+            except sqlite3.Error:
+                self.errors += 1
+            self.hits = self.misses = self.evictions = self.errors = 0
+
+
+# Shared by every session in the server process
+symbolic_store = SymbolicStore()
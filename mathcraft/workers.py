@@ -0,0 +1,220 @@
+"""Time-boxed SymPy calls in a bounded pool of worker processes.
+
+``sp.limit``, ``sp.solve`` and ``continuous_domain`` on arbitrary user text
+can run for minutes, and a thread stuck in one cannot be interrupted. Here
+they run in worker processes instead: the caller waits at most a time
+budget, and a worker that overruns it (or whose caller gave up) is killed
+and replaced, so one pathological input costs a few seconds rather than a
+frozen session.
+"""
+import multiprocessing
+import threading
+import time
+
+# Seconds a call may take, queueing included, before it is reported as timed out
+DEFAULT_TIMEOUT = 5.0
+DEFAULT_WORKERS = 2
+
+# How often a waiting caller checks its deadline and cancel callback
+_POLL_INTERVAL = 0.05
+
+
+class SymbolicTimeout(TimeoutError):
+    """A pooled call overran its time budget; its worker was killed."""
+
+
+class SymbolicCancelled(SymbolicTimeout):
+    """A pooled call was abandoned by its caller before it finished."""
+
+
+def _worker_main(conn):
+    """Worker loop: run ``(func, args)`` tasks and send back ``(ok, value)``."""
+    while True:
+        try:
+            func, args = conn.recv()
+        except EOFError:
+            return
+        try:
+            reply = (True, func(*args))
+        except Exception as exc:
+            reply = (False, exc)
+        try:
+            conn.send(reply)
+        except Exception as exc:  # unpicklable result or exception
+            conn.send((False, RuntimeError(f"could not return result: {exc}")))
+
+
+def _context():
+    """Start workers from a preloaded fork server where possible, so replacing one is cheap."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["mathcraft.engine"])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+class _Worker:
+    """One worker process and the parent end of its pipe."""
+
+    __slots__ = ("process", "conn")
+
+    def __init__(self, context):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class SymbolicPool:
+    """At most ``max_workers`` concurrent calls, each limited to ``timeout`` seconds.
+
+    Workers are started on first use and kept for later calls. ``func`` must
+    be a module-level function so it can be sent to the worker.
+    """
+
+    def __init__(self, max_workers=DEFAULT_WORKERS, timeout=DEFAULT_TIMEOUT):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._context = None
+        self._idle = []
+        self._slots = threading.Semaphore(max_workers)
+        self._lock = threading.Lock()
+        self._busy = 0
+        self._waiting = 0
+        self._calls = 0
+        self._timeouts = 0
+        self._cancelled = 0
+
+    def _wait(self, ready, deadline, cancel):
+        """Poll ``ready(seconds)`` until it is true; ``False`` once ``deadline`` passes.
+
+        Raises ``SymbolicCancelled`` as soon as ``cancel()`` returns true.
+        """
+        while True:
+            if cancel is not None and cancel():
+                raise SymbolicCancelled("cancelled")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if ready(min(remaining, _POLL_INTERVAL)):
+                return True
+
+    def _checkout(self):
+        with self._lock:
+            self._busy += 1
+            if self._idle:
+                return self._idle.pop()
+            if self._context is None:
+                self._context = _context()
+        return _Worker(self._context)
+
+    def _release(self, worker, keep):
+        if not keep:
+            worker.kill()
+        with self._lock:
+            self._busy -= 1
+            if keep:
+                self._idle.append(worker)
+        self._slots.release()
+
+    def run(self, func, *args, timeout=None, cancel=None):
+        """``func(*args)`` in a worker process, within ``timeout`` seconds.
+
+        ``cancel`` is an optional callable polled while waiting; once it
+        returns true the call is abandoned. Exceptions raised by ``func``
+        are re-raised here. Raises ``SymbolicTimeout`` (or
+        ``SymbolicCancelled``) instead of waiting past the budget.
+        """
+        budget = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + budget
+
+        with self._lock:
+            self._calls += 1
+            self._waiting += 1
+        try:
+            acquired = self._wait(lambda seconds: self._slots.acquire(timeout=seconds), deadline, cancel)
+        except SymbolicCancelled:
+            with self._lock:
+                self._cancelled += 1
+            raise
+        finally:
+            with self._lock:
+                self._waiting -= 1
+        if not acquired:
+            with self._lock:
+                self._timeouts += 1
+            raise SymbolicTimeout(f"timed out after {budget:g} s waiting for a free worker")
+
+        worker = self._checkout()
+        try:
+            worker.conn.send((func, args))
+            finished = self._wait(worker.conn.poll, deadline, cancel)
+            if finished:
+                ok, value = worker.conn.recv()
+        except SymbolicCancelled:
+            self._release(worker, keep=False)
+            with self._lock:
+                self._cancelled += 1
+            raise
+        except (EOFError, OSError) as exc:
+            self._release(worker, keep=False)
+            raise RuntimeError(f"symbolic worker died: {exc}") from exc
+
+        if not finished:
+            self._release(worker, keep=False)
+            with self._lock:
+                self._timeouts += 1
+            raise SymbolicTimeout(f"timed out after {budget:g} s")
+
+        self._release(worker, keep=True)
+        if not ok:
+            raise value
+        return value
+
+    def resize(self, max_workers, timeout=None):
+        """Change the worker limit (and default ``timeout``) of a pool with no calls in flight.
+
+        Used by batch runs to size the shared pool to the machine.
+        """
+        with self._lock:
+            if self._busy or self._waiting:
+                raise RuntimeError("cannot resize a pool with calls in flight")
+            self.max_workers = max_workers
+            self._slots = threading.Semaphore(max_workers)
+            if timeout is not None:
+                self.timeout = timeout
+
+    def stats(self):
+        """Pool size, ``busy``/``queue_depth`` right now, and call/timeout/cancel counters."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "timeout": self.timeout,
+                "workers": self._busy + len(self._idle),
+                "busy": self._busy,
+                "queue_depth": self._waiting,
+                "calls": self._calls,
+                "timeouts": self._timeouts,
+                "cancelled": self._cancelled,
+            }
+
+    def shutdown(self):
+        """Stop the idle workers; busy ones are stopped when their call returns."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.kill()
+
+
+# Shared by every session in the server process
+symbolic_pool = SymbolicPool()
+
+
+def run_symbolic(func, *args, timeout=None, cancel=None):
+    """Run ``func(*args)`` on the shared pool (see ``SymbolicPool.run``)."""
+    return symbolic_pool.run(func, *args, timeout=timeout, cancel=cancel)
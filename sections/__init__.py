@@ -0,0 +1,6 @@
+"""Streamlit pages of the MathCraft app, one module per section.
+
+Each module exposes ``render()``; ``app.py`` imports a module only when its
+section is selected (or its manipulative expander is opened), so a rerun
+executes the code for what is on screen and nothing else.
+"""
@@ -0,0 +1,83 @@
+"""Asymptote Explorer: horizontal asymptotes by degree comparison, oblique ones by long division."""
+import streamlit as st
+
+from mathcraft import engine, figures
+from mathcraft.figure_cache import cached_figure
+
+
+def render():
+    st.header("📊 Asymptote Explorer")
+    
+    st.markdown("""
+    <div class='interactive-section'>
+    <h4>🔍 Understanding Different Types of Asymptotes</h4>
+    <p>Explore horizontal, vertical, and oblique asymptotes with interactive examples!</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    asymptote_type = st.selectbox(
+        "Choose asymptote type to explore:",
+        ["Horizontal Asymptotes", "Vertical Asymptotes", "Oblique Asymptotes"]
+    )
+    
+    if asymptote_type == "Horizontal Asymptotes":
+        st.subheader("Horizontal Asymptotes: Degree Comparison")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            degree_num = st.selectbox("Degree of numerator", [0, 1, 2, 3], index=2)
+            degree_den = st.selectbox("Degree of denominator", [0, 1, 2, 3], index=2)
+        
+        with col2:
+            result, color = engine.degree_comparison(degree_num, degree_den)
+            
+            st.markdown(f"""
+            <div style='padding: 1rem; background-color: {color}20; border-radius: 8px; border-left: 4px solid {color};'>
+            <h4 style='color: {color};'>Result:</h4>
+            <p>{result}</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Generate example functions based on degrees
+        examples = engine.asymptote_examples(degree_num, degree_den)
+        
+        if examples:
+            selected_example = st.selectbox("Try these examples:", examples)
+            
+            # Parse and plot the selected example
+            try:
+                fig = cached_figure(
+                    ("asymptote_example", selected_example, degree_num, degree_den),
+                    lambda: figures.example_figure(engine.example_curve(selected_example),
+                                                   selected_example, degree_num, degree_den)
+                )
+                st.plotly_chart(fig, use_container_width=True)
+                
+            except Exception:
+                st.write("Example function visualization")
+
+    elif asymptote_type == "Oblique Asymptotes":
+        st.subheader("Oblique Asymptotes: Polynomial Long Division")
+
+        st.markdown("""
+        When the numerator's degree is higher than the denominator's, divide:
+        f(x) = q(x) + r(x)/d(x). The remainder term r(x)/d(x) → 0 as x → ±∞,
+        so the graph approaches y = q(x), a slant line when the degrees differ by one.
+        """)
+
+        example = st.selectbox("Try these examples:", engine.OBLIQUE_EXAMPLES, key="oblique_example")
+        curve = engine.oblique_example(example)
+        quotient, remainder = curve["quotient"], curve["remainder"]
+        _, denominator = engine.rational_polynomials(example)
+
+        st.markdown(f"""
+        <div class='formula-box'>
+        <h4>Long Division:</h4>
+        <p>f(x) = {quotient.format()} + ({remainder.format()}) / ({denominator.format()})</p>
+        <p><strong>{engine.describe_asymptote(quotient)}</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        fig = cached_figure(("oblique_example", example), lambda: figures.oblique_figure(curve, example))
+        st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,61 @@
+"""Asymptote Finder manipulative: horizontal/vertical asymptotes and domain."""
+import streamlit as st
+
+from mathcraft import engine
+from mathcraft.workers import SymbolicCancelled
+from sections.symbolic import input_changed, timeout_message
+
+
+def render():
+    st.subheader("Complete Asymptote Analysis")
+    
+    func_input = st.text_input("Enter function for asymptote analysis:", "(x**2 + 1)/(x**2 - 4)")
+    
+    if st.button("🔍 Find All Asymptotes"):
+        try:
+            analysis = engine.find_asymptotes(func_input, cancel=input_changed)
+            ha_pos, ha_neg = analysis["ha_pos"], analysis["ha_neg"]
+            
+            st.write("**Analysis Results:**")
+            
+            # Horizontal asymptotes
+            if ha_pos is None or ha_neg is None:
+                st.write("🔸 **Horizontal Asymptotes:** timed out")
+            elif ha_pos == ha_neg and ha_pos.is_finite:
+                st.write(f"🔸 **Horizontal Asymptote:** y = {ha_pos}")
+            elif ha_pos.is_finite or ha_neg.is_finite:
+                st.write(f"🔸 **Horizontal Asymptotes:** x→+∞: y = {ha_pos}, x→-∞: y = {ha_neg}")
+            else:
+                st.write("🔸 **No Horizontal Asymptotes**")
+            
+            # Vertical asymptotes: exact for rational inputs, else zeros of the denominator
+            if "vertical" in analysis["timed_out"]:
+                st.write("🔸 **Vertical Asymptotes:** timed out")
+            elif analysis["vertical"] is not None:
+                if not analysis["vertical"]:
+                    st.write("🔸 **No Vertical Asymptotes**")
+                elif analysis["method"] == "rational":
+                    st.write(f"🔸 **Vertical Asymptotes at:** x = {analysis['vertical']}")
+                else:
+                    st.write(f"🔸 **Potential Vertical Asymptotes at:** x = {analysis['vertical']}")
+            
+            # Removable discontinuities (rational inputs only)
+            if analysis["holes"]:
+                points = ", ".join(f"({hole_x}, {hole_y})" for hole_x, hole_y in analysis["holes"])
+                st.write(f"🔸 **Holes (removable discontinuities) at:** {points}")
+            
+            # Domain
+            if "domain" in analysis["timed_out"]:
+                st.write("🔸 **Domain:** timed out")
+            elif analysis["domain"] is not None:
+                st.write(f"🔸 **Domain:** {analysis['domain']}")
+            else:
+                st.write("🔸 **Domain:** Analysis not available")
+            
+            if analysis["timed_out"]:
+                st.warning(timeout_message("Part of the analysis"))
+                
+        except SymbolicCancelled:
+            pass  # the rerun for the new input is already queued
+        except Exception as e:
+            st.error(f"Error in analysis: {str(e)}")
@@ -0,0 +1,299 @@
+"""FTC Visualizer: both parts of the Fundamental Theorem of Calculus."""
+import streamlit as st
+
+from mathcraft import engine, figures
+from mathcraft.figure_cache import cached_figure
+from mathcraft.workers import SymbolicCancelled
+from sections.symbolic import input_changed
+
+
+@st.fragment
+def _part1_panel():
+    """Function, lower bound and window controls with the f / F plot for Part 1; reruns on its own."""
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Function selection
+        func_choice = st.selectbox("Choose function f(t):", [*engine.FTC_PART1_FUNCTIONS, "Custom"])
+        if func_choice == "Custom":
+            label = text = st.text_input("f(t) = ", "t*exp(-t)", key="ftc_part1_custom",
+                                         help="Any function of t, e.g. sin(t)/t or exp(-t**2)")
+        else:
+            label, text = func_choice, engine.FTC_PART1_FUNCTIONS[func_choice]
+    
+    with col2:
+        a = st.slider("Lower bound (a)", -5.0, 5.0, 0.0, 0.1, key="ftc_part1_a")
+        x_min, x_max = st.slider("Window (x)", -10.0, 10.0, (0.0, 5.0), 0.1, key="ftc_part1_window")
+    
+    # Create interactive visualization
+    try:
+        result = engine.ftc_part1(text, a, x_min, x_max, cancel=input_changed)
+    except SymbolicCancelled:
+        return  # the rerun for the new input is already queued
+    except Exception as e:
+        st.error(f"Error integrating f(t) = {text}: {str(e)}")
+        return
+    
+    # F differs once SymPy's antiderivative replaces the quadrature; the label is the title
+    fig = cached_figure(("ftc_part1", text, label, a, x_min, x_max, result["method"]),
+                        lambda: figures.ftc_part1_figure(result, label))
+    st.plotly_chart(fig, use_container_width=True)
+    
+    defined = result["defined"]
+    if not defined.any():
+        st.warning(f"∫ from a = {a:g} diverges (or f is undefined) across the whole window, "
+                   "so F(x) has no value here.")
+        return
+    if not defined.all():
+        st.caption("F(x) is left out where the integral diverges or f is undefined; "
+                   "no error bound applies there.")
+    if result["method"] == "symbolic":
+        st.caption(f"F(x) = G(x) − G({a:g}) with the antiderivative G(x) = ${result['antiderivative']}$; "
+                   f"it agrees with the Gauss–Kronrod quadrature to {result['max_error']:.1e}.")
+    else:
+        st.caption(f"F(x) by adaptive 15-point Gauss–Kronrod quadrature; "
+                   f"error estimate ≤ {result['max_error']:.1e}.")
+
+
+@st.fragment
+def _part2_panel():
+    """Bound sliders, the F(b) − F(a) calculation and the shaded-area plot; reruns on its own."""
+    # Interactive area calculation
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        a = st.slider("Lower bound (a)", -5.0, 5.0, 0.0, 0.1)
+        b = st.slider("Upper bound (b)", -5.0, 5.0, 3.0, 0.1)
+        func_choice = st.selectbox("Function:", ["x²", "sin(x)", "x³ - 2x"])
+    
+    with col2:
+        # Calculate definite integral
+        result = engine.ftc_part2(func_choice, a, b)
+        func_latex, anti_latex = result["func_latex"], result["anti_latex"]
+        
+        if result["method"] == "symbolic":
+            value_line = f"<p><strong>= {result['integral']:.3f}</strong></p>"
+        else:
+            value_line = (f"<p><strong>≈ {result['integral']:.3f}</strong> "
+                          f"(adaptive quadrature, error ≤ {result['error']:.1e})</p>")
+        
+        if anti_latex is not None:
+            st.markdown(f"""
+            <div class='formula-box'>
+            <h4>Calculation:</h4>
+            <p>∫{func_latex} dx = {anti_latex} + C</p>
+            <p>∫ₐᵇ{func_latex} dx = [{anti_latex}]ₐᵇ</p>
+            <p>= {anti_latex}|ₓ₌{b} - {anti_latex}|ₓ₌{a}</p>
+            <p>= {result["F_b"]:.3f} - {result["F_a"]:.3f}</p>
+            {value_line}
+            </div>
+            """, unsafe_allow_html=True)
+        else:
+            st.markdown(f"""
+            <div class='formula-box'>
+            <h4>Calculation:</h4>
+            <p>No antiderivative of {func_latex} found in time.</p>
+            <p>∫ₐᵇ{func_latex} dx</p>
+            {value_line}
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Create visualization with shaded area
+    fig = cached_figure(("ftc_part2", func_choice, a, b),
+                        lambda: figures.ftc_part2_figure(result, func_choice, a, b))
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def render():
+    st.header("🧮 Fundamental Theorem of Calculus Visualizer")
+    
+    st.markdown("""
+    <div class='interactive-section'>
+    <h4>🔗 Connecting Derivatives and Integrals</h4>
+    <p>See the beautiful relationship between differentiation and integration!</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # FTC Part selection
+    ftc_part = st.selectbox("Choose FTC part to explore:", ["Part 1: Derivative of Integral", "Part 2: Evaluation Theorem"])
+    
+    if ftc_part == "Part 1: Derivative of Integral":
+        st.subheader("FTC Part 1: d/dx[∫f(t)dt] = f(x)")
+        
+        _part1_panel()
+        
+        st.markdown("""
+        <div class='concept-card'>
+        <h4>🔍 Key Insight:</h4>
+        <p>Notice how the <strong>slope</strong> of the integral function F(x) (bottom graph) 
+        matches the <strong>value</strong> of the original function f(t) (top graph) at each point!</p>
+        <p>This is exactly what FTC Part 1 tells us: <strong>F'(x) = f(x)</strong></p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    else:  # Part 2
+        st.subheader("FTC Part 2: ∫ₐᵇf(x)dx = F(b) - F(a)")
+        
+        _part2_panel()
+        
+    # Historical context and real-world applications
+    st.markdown("""
+    <div class='interactive-section'>
+    <h4>🏛️ Historical Context & Development</h4>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class='concept-card'>
+    <h4>📜 The Great Mathematical Revolution</h4>
+    <p>The Fundamental Theorem of Calculus represents one of the most profound discoveries in mathematics, 
+    connecting two seemingly unrelated concepts: <strong>differentiation</strong> (rates of change) and 
+    <strong>integration</strong> (accumulation). This connection revolutionized mathematics, science, and engineering.</p>
+    
+    <h5>🧑‍🔬 Key Historical Figures:</h5>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    hist_col1, hist_col2 = st.columns(2)
+    
+    with hist_col1:
+        st.markdown("""
+        <div style='background: #e3f2fd; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #2196f3;'>
+        <h5>🇬🇧 Isaac Newton (1642-1727)</h5>
+        <p><strong>Motivation:</strong> Needed to solve physics problems - planetary motion, gravity, optics</p>
+        <p><strong>Approach:</strong> Developed "method of fluxions" - thinking of derivatives as "flowing quantities"</p>
+        <p><strong>Key Insight:</strong> Realized that finding areas (integration) was the inverse of finding slopes (differentiation)</p>
+        </div>
+        
+        <div style='background: #f3e5f5; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #9c27b0; margin-top: 1rem;'>
+        <h5>🇩🇪 Gottfried Leibniz (1646-1716)</h5>
+        <p><strong>Motivation:</strong> Philosophical interest in infinite processes and logical reasoning</p>
+        <p><strong>Approach:</strong> Created the notation we still use: dx, ∫, d/dx</p>
+        <p><strong>Key Contribution:</strong> Made calculus more systematic and teachable through better notation</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with hist_col2:
+        st.markdown("""
+        <div style='background: #e8f5e8; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #4caf50;'>
+        <h5>⚔️ The Great Calculus War</h5>
+        <p><strong>The Conflict:</strong> Newton and Leibniz developed calculus independently, leading to a bitter priority dispute</p>
+        <p><strong>Newton's Claim:</strong> Developed it earlier (1665-1666) but didn't publish</p>
+        <p><strong>Leibniz's Claim:</strong> Published first (1684) with better notation</p>
+        <p><strong>Resolution:</strong> Both credited as co-inventors, each contributed essential elements</p>
+        </div>
+        
+        <div style='background: #fff3e0; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #ff9800; margin-top: 1rem;'>
+        <h5>🎯 Why Was This Revolutionary?</h5>
+        <p><strong>Before FTC:</strong> Finding areas and slopes were completely separate, tedious problems</p>
+        <p><strong>After FTC:</strong> One unified theory solved both problems efficiently</p>
+        <p><strong>Impact:</strong> Enabled the Scientific Revolution and modern engineering</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class='formula-box'>
+    <h4>🔗 The Revolutionary Connection</h4>
+    <p>The FTC revealed that <strong>differentiation and integration are inverse operations</strong> - like addition and subtraction, or multiplication and division. This wasn't obvious before!</p>
+    
+    <p style='text-align: center; font-size: 1.2em;'>
+    <strong>Problem:</strong> Find the area under f(x) = x² from 0 to 3
+    </p>
+    
+    <p><strong>Before FTC:</strong> Use geometric methods, exhausting approximations → Hours of work</p>
+    <p><strong>After FTC:</strong> Find antiderivative F(x) = x³/3, compute F(3) - F(0) = 9 → Seconds!</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Real-world applications
+    st.markdown("""
+    <div class='interactive-section'>
+    <h4>🌍 Real-World Applications of the Fundamental Theorem</h4>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    ftc_col1, ftc_col2 = st.columns(2)
+    
+    with ftc_col1:
+        st.markdown("""
+        <div style='background: #e3f2fd; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #2196f3;'>
+        <h5>🚀 Space Exploration</h5>
+        <p><strong>Rocket Trajectories:</strong> NASA uses FTC to calculate fuel consumption (integrate burn rate) and predict orbital paths (integrate velocity to get position).</p>
+        <p><strong>Example:</strong> Mars rover landing - integrate deceleration profile to ensure safe touchdown velocity.</p>
+        </div>
+        
+        <div style='background: #f3e5f5; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #9c27b0; margin-top: 1rem;'>
+        <h5>💰 Financial Markets</h5>
+        <p><strong>Options Pricing:</strong> Black-Scholes model uses FTC to calculate option values by integrating probability distributions over possible stock prices.</p>
+        <p><strong>Portfolio Analysis:</strong> Total return calculation by integrating dividend and price change rates over time.</p>
+        </div>
+        
+        <div style='background: #e8f5e8; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #4caf50; margin-top: 1rem;'>
+        <h5>🎵 Audio Engineering</h5>
+        <p><strong>Digital Music:</strong> Converting between sound waves (continuous) and digital files (discrete) using FTC principles.</p>
+        <p><strong>Noise Cancellation:</strong> Headphones integrate incoming sound waves to generate precise canceling waves.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with ftc_col2:
+        st.markdown("""
+        <div style='background: #fff3e0; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #ff9800;'>
+        <h5>🏥 Medical Technology</h5>
+        <p><strong>MRI/CT Scans:</strong> Image reconstruction uses FTC to build 3D body images from 2D slice data by integrating cross-sectional information.</p>
+        <p><strong>Pharmacokinetics:</strong> Drug dosing schedules calculated by integrating absorption and elimination rates.</p>
+        </div>
+        
+        <div style='background: #ffebee; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #f44336; margin-top: 1rem;'>
+        <h5>🌍 Climate Science</h5>
+        <p><strong>Global Warming Models:</strong> Climate scientists integrate temperature changes over time and geography to predict future conditions.</p>
+        <p><strong>Carbon Footprint:</strong> Total emissions calculated by integrating emission rates across activities and time.</p>
+        </div>
+        
+        <div style='background: #e0f2f1; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #009688; margin-top: 1rem;'>
+        <h5>🎮 Video Games & Animation</h5>
+        <p><strong>Physics Engines:</strong> Game physics use FTC to calculate realistic motion - integrate acceleration to get velocity, integrate velocity to get position.</p>
+        <p><strong>3D Animation:</strong> Smooth character movement by integrating motion paths and deformation rates.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 1.5rem; border-radius: 10px; color: white; margin: 1rem 0;'>
+    <h5>🎯 Why FTC Changed Everything</h5>
+    <p><strong>Before FTC:</strong> Mathematics was largely geometric and arithmetic</p>
+    <p><strong>After FTC:</strong> Mathematics became the language of change and motion</p>
+    
+    <p><strong>This enabled:</strong></p>
+    <ul>
+    <li>🏭 <strong>Industrial Revolution:</strong> Steam engines, manufacturing optimization</li>
+    <li>⚡ <strong>Electrical Age:</strong> Circuit analysis, electromagnetic theory</li>
+    <li>✈️ <strong>Modern Transportation:</strong> Aerodynamics, automotive engineering</li>
+    <li>💻 <strong>Digital Age:</strong> Signal processing, computer graphics, AI</li>
+    <li>🌌 <strong>Space Age:</strong> Orbital mechanics, rocket science</li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Modern perspective
+    st.markdown("""
+    <div class='concept-card'>
+    <h4>🔬 Modern Perspective: Why Students Should Care</h4>
+    
+    <h5>📱 Technology You Use Daily:</h5>
+    <ul>
+    <li><strong>GPS Navigation:</strong> Your phone integrates velocity data to track your location</li>
+    <li><strong>Streaming Video:</strong> Compression algorithms use calculus to optimize file sizes</li>
+    <li><strong>Battery Management:</strong> Your phone predicts battery life by integrating power consumption</li>
+    <li><strong>Camera Autofocus:</strong> Calculus optimizes lens position for sharpest image</li>
+    </ul>
+    
+    <h5>🎯 Career Applications:</h5>
+    <ul>
+    <li><strong>Data Science:</strong> Machine learning algorithms optimize by finding where derivatives equal zero</li>
+    <li><strong>Engineering:</strong> Every engineering field uses calculus for design and analysis</li>
+    <li><strong>Business:</strong> Optimization problems in logistics, marketing, and finance</li>
+    <li><strong>Medicine:</strong> Medical imaging, drug development, and biomechanics</li>
+    </ul>
+    
+    <p><strong>Bottom Line:</strong> The FTC isn't just math history - it's the foundation of the modern technological world!</p>
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,87 @@
+"""Function Builder: term-by-term rational functions and their asymptotes."""
+import streamlit as st
+
+from mathcraft import engine, figures
+
+
+def render():
+    st.header("🔧 Interactive Function Builder")
+    
+    st.markdown("""
+    <div class='interactive-section'>
+    <h4>🎨 Build Your Own Rational Functions</h4>
+    <p>Create custom functions and observe their behavior!</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Function builder interface
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("📝 Function Components")
+        
+        # Numerator builder
+        st.write("**Numerator:**")
+        num_terms = st.number_input("Number of terms in numerator", 1, 20, 3)
+        
+        numerator_coeffs = []
+        numerator_powers = []
+        
+        for i in range(num_terms):
+            col_a, col_b = st.columns(2)
+            with col_a:
+                coeff = st.number_input(f"Coefficient {i+1}", -10.0, 10.0, 1.0, key=f"num_coeff_{i}")
+                numerator_coeffs.append(coeff)
+            with col_b:
+                power = st.number_input(f"Power of x {i+1}", 0, 20, max(0, num_terms-i-1), key=f"num_pow_{i}")
+                numerator_powers.append(power)
+        
+        # Denominator builder
+        st.write("**Denominator:**")
+        den_terms = st.number_input("Number of terms in denominator", 1, 20, 2)
+        
+        denominator_coeffs = []
+        denominator_powers = []
+        
+        for i in range(den_terms):
+            col_a, col_b = st.columns(2)
+            with col_a:
+                coeff = st.number_input(f"Coefficient {i+1}", -10.0, 10.0, 1.0, key=f"den_coeff_{i}")
+                denominator_coeffs.append(coeff)
+            with col_b:
+                power = st.number_input(f"Power of x {i+1}", 0, 20, max(0, den_terms-i-1), key=f"den_pow_{i}")
+                denominator_powers.append(power)
+    
+    with col2:
+        st.subheader("📊 Function Analysis")
+        
+        # Build function string and analyze the function
+        analysis = engine.builder_analysis(numerator_coeffs, numerator_powers,
+                                           denominator_coeffs, denominator_powers)
+        
+        st.markdown(f"""
+        <div class='formula-box'>
+        <h4>Your Function:</h4>
+        <p>f(x) = ({analysis["num_str"]}) / ({analysis["den_str"]})</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div class='concept-card'>
+        <h4>Analysis:</h4>
+        <p><strong>Degree of numerator:</strong> {analysis["num_degree"]}</p>
+        <p><strong>Degree of denominator:</strong> {analysis["den_degree"]}</p>
+        <p><strong>Asymptote:</strong> {analysis["analysis"]}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Plot the function
+        if st.button("🎨 Graph Function"):
+            try:
+                curve = engine.builder_curve(numerator_coeffs, numerator_powers,
+                                             denominator_coeffs, denominator_powers)
+                fig = figures.builder_figure(curve, analysis["asymptote"])
+                st.plotly_chart(fig, use_container_width=True)
+                
+            except Exception as e:
+                st.error(f"Error plotting function: {str(e)}")
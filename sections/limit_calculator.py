@@ -0,0 +1,39 @@
+"""Limit Calculator manipulative: a symbolic limit of any expression."""
+import streamlit as st
+
+from mathcraft import engine
+from mathcraft.workers import SymbolicCancelled, SymbolicTimeout
+from sections.symbolic import input_changed, timeout_message
+
+
+def render():
+    st.subheader("Step-by-Step Limit Solver")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write("**Enter your function:**")
+        user_function = st.text_input("f(x) = ", "3*x**2/(x**2 - 1)", help="Use Python syntax: x**2 for x², sin(x), exp(x), etc.")
+        limit_point = st.selectbox("Evaluate limit as x approaches:", ["∞", "-∞", "0", "1", "-1", "Custom"])
+        
+        if limit_point == "Custom":
+            custom_point = st.number_input("Enter custom point:", value=0.0)
+            limit_point = custom_point
+    
+    with col2:
+        if st.button("🧮 Calculate Limit"):
+            try:
+                limit_val = engine.calculate_limit(user_function, limit_point, cancel=input_changed)
+                
+                st.success(f"lim(x→{limit_point}) {user_function} = {limit_val}")
+                
+                # Show steps for rational functions
+                if "/" in user_function and limit_point in ["∞", "-∞"]:
+                    st.info("💡 For rational functions at infinity, divide by the highest power of x in the denominator!")
+                
+            except SymbolicCancelled:
+                pass  # the rerun for the new input is already queued
+            except SymbolicTimeout:
+                st.warning(timeout_message("The limit"))
+            except Exception as e:
+                st.error(f"Error calculating limit: {str(e)}")
@@ -0,0 +1,174 @@
+"""Interactive Limits: limits at infinity of a rational function."""
+import streamlit as st
+
+from mathcraft import components, engine, figures
+
+# Session-state keys and defaults of the coefficient and range sliders
+_SLIDER_DEFAULTS = {
+    "num_x2": 3, "num_x1": 0, "num_const": 0,
+    "den_x2": 1, "den_x1": 0, "den_const": -1,
+    "limits_x_range": 20,
+}
+
+
+@st.fragment
+def _coefficient_panel():
+    """Coefficient sliders, solution steps and plot; reruns on its own when a control changes.
+
+    With "Evaluate in browser" on, the sliders and plot are the client-side
+    ``limits_plot`` component and the panel reruns only when a slider is released.
+    """
+    client_side = st.toggle(
+        "⚡ Evaluate in browser", key="limits_client_side",
+        help="Redraw the curve in the browser while a slider moves; the server only sees the released values."
+    )
+    
+    if client_side:
+        view_col1, view_col2 = st.columns(2)
+        show_asymptote = view_col1.checkbox("Show Horizontal Asymptote", True)
+        show_steps = view_col2.checkbox("Show Solution Steps", True)
+        
+        state = [st.session_state.get(key, default) for key, default in _SLIDER_DEFAULTS.items()]
+        (a2, a1, a0), (b2, b1, b0), x_range = components.limits_plot(
+            state[0:3], state[3:6], state[6], show_asymptote, key="limits_plot"
+        )
+        # Keep the server-side sliders in step for when the toggle is switched off
+        for key, value in zip(_SLIDER_DEFAULTS, (a2, a1, a0, b2, b1, b0, x_range)):
+            st.session_state[key] = value
+    else:
+        # Interactive controls
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.subheader("Numerator Coefficients")
+            a2 = st.slider("x² coefficient", -10, 10, 3, key="num_x2")
+            a1 = st.slider("x coefficient", -10, 10, 0, key="num_x1")
+            a0 = st.slider("constant", -10, 10, 0, key="num_const")
+        
+        with col2:
+            st.subheader("Denominator Coefficients")
+            b2 = st.slider("x² coefficient", -10, 10, 1, key="den_x2")
+            b1 = st.slider("x coefficient", -10, 10, 0, key="den_x1")
+            b0 = st.slider("constant", -10, 10, -1, key="den_const")
+        
+        with col3:
+            st.subheader("View Settings")
+            x_range = st.slider("X-axis range", 1, 50, 20, key="limits_x_range")
+            show_asymptote = st.checkbox("Show Horizontal Asymptote", True)
+            show_steps = st.checkbox("Show Solution Steps", True)
+    
+    
+    # Create the function
+    if b2 != 0:  # Avoid division by zero in denominator leading coefficient
+        # Display the function
+        st.markdown(f"""
+        <div class='formula-box'>
+        <h4>Current Function:</h4>
+        <p style='font-size: 1.2em; text-align: center;'>
+        f(x) = ({a2}x² + {a1}x + {a0}) / ({b2}x² + {b1}x + {b0})
+        </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Calculate limit and sample the curve (the browser samples its own)
+        if client_side:
+            limit_val = a2 / b2
+        else:
+            curve = engine.limits_curve((a2, a1, a0), (b2, b1, b0), x_range)
+            limit_val = curve["limit"]
+        
+        # Show step-by-step solution
+        if show_steps:
+            st.markdown("""
+            <div class='concept-card'>
+            <h4>📝 Step-by-Step Solution</h4>
+            """, unsafe_allow_html=True)
+            
+            st.markdown(f"""
+            **Step 1:** Identify the highest power of x in both numerator and denominator.
+            - Highest power: x²
+            
+            **Step 2:** Divide both numerator and denominator by x²:
+            $\\frac{{{a2} + \\frac{{{a1}}}{{x}} + \\frac{{{a0}}}{{x^2}}}}{{{b2} + \\frac{{{b1}}}{{x}} + \\frac{{{b0}}}{{x^2}}}}$
+            
+            **Step 3:** Take the limit as x → ∞:
+            - Terms with x in denominator approach 0
+            - Result: {a2}/{b2} = {limit_val:.3f}
+            
+            **Conclusion:** The horizontal asymptote is y = {limit_val:.3f}
+            """)
+            st.markdown("</div>", unsafe_allow_html=True)
+        
+        # Create interactive plot
+        if client_side:
+            return
+        try:
+            fig = figures.limits_figure(curve, show_asymptote)
+            st.plotly_chart(fig, use_container_width=True)
+        except Exception:
+            st.error("Unable to plot function with current parameters. Try different values!")
+
+
+def render():
+    st.header("🎯 Interactive Limits Explorer")
+    
+    st.markdown("""
+    <div class='interactive-section'>
+    <h4>🔍 Explore Limits at Infinity</h4>
+    <p>Use the controls below to modify rational functions and observe their limiting behavior!</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    _coefficient_panel()
+    
+    # Real-world applications section
+    st.markdown("""
+    <div class='interactive-section'>
+    <h4>🌍 Real-World Applications of Limits & Asymptotes</h4>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    limit_col1, limit_col2 = st.columns(2)
+    
+    with limit_col1:
+        st.markdown("""
+        <div style='background: #e3f2fd; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #2196f3;'>
+        <h5>📱 Technology & Engineering</h5>
+        <p><strong>Internet Speed:</strong> Your internet connection has a maximum bandwidth (horizontal asymptote). No matter how many devices you add, your total speed approaches but never exceeds this limit.</p>
+        <p><strong>CPU Performance:</strong> Computer processors have thermal limits - performance approaches maximum capacity as temperature increases.</p>
+        </div>
+        
+        <div style='background: #f3e5f5; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #9c27b0; margin-top: 1rem;'>
+        <h5>🧬 Biology & Medicine</h5>
+        <p><strong>Drug Saturation:</strong> When taking medication, your blood concentration approaches a maximum level (asymptote) - taking more doesn't increase effectiveness.</p>
+        <p><strong>Population Growth:</strong> Animal populations approach carrying capacity of their environment - they can't grow indefinitely.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with limit_col2:
+        st.markdown("""
+        <div style='background: #e8f5e8; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #4caf50;'>
+        <h5>💰 Economics & Business</h5>
+        <p><strong>Market Saturation:</strong> Sales of a new product approach a maximum market size - there's a limit to how many customers exist.</p>
+        <p><strong>Learning Curves:</strong> Employee productivity improves quickly at first, then approaches a maximum skill level asymptotically.</p>
+        </div>
+        
+        <div style='background: #fff3e0; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #ff9800; margin-top: 1rem;'>
+        <h5>🌡️ Physics & Chemistry</h5>
+        <p><strong>Terminal Velocity:</strong> Falling objects approach a maximum speed due to air resistance - they can't accelerate indefinitely.</p>
+        <p><strong>Chemical Reactions:</strong> Reaction rates approach zero as reactants are consumed - the reaction effectively "stops."</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div style='background: linear-gradient(135deg, #ff6b6b 0%, #4ecdc4 100%); padding: 1.5rem; border-radius: 10px; color: white; margin: 1rem 0;'>
+    <h5>🎯 Everyday Examples You've Experienced</h5>
+    <ul>
+    <li>📶 <strong>Cell Phone Signal:</strong> Bars approach maximum as you get closer to tower</li>
+    <li>🔋 <strong>Phone Charging:</strong> Battery percentage approaches 100% more slowly near the end</li>
+    <li>☕ <strong>Coffee Temperature:</strong> Hot coffee approaches room temperature asymptotically</li>
+    <li>🚗 <strong>Car Acceleration:</strong> Your car approaches its top speed but can't exceed it</li>
+    <li>💡 <strong>Learning a Skill:</strong> Improvement rate slows as you approach mastery</li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,147 @@
+"""MVT Explorer: the Mean Value Theorem on a chosen interval."""
+import math
+
+import streamlit as st
+
+from mathcraft import engine, figures
+from mathcraft.figure_cache import cached_figure
+
+
+@st.fragment
+def _mvt_panel():
+    """Function and endpoint controls with the MVT calculation and plot; reruns on its own."""
+    # Interactive MVT demonstration
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("🎛️ Function Controls")
+        mvt_function = st.selectbox("Choose function:", [
+            "x²", "x³ - 3x", "sin(x)", "x³ - 2x² + x + 1", "ln(x+2)"
+        ])
+        
+        if mvt_function in ["x²", "x³ - 3x", "x³ - 2x² + x + 1"]:
+            a_mvt = st.slider("Left endpoint (a)", -3.0, 3.0, -1.0, 0.1, key="mvt_a")
+            b_mvt = st.slider("Right endpoint (b)", -3.0, 3.0, 2.0, 0.1, key="mvt_b")
+        elif mvt_function == "sin(x)":
+            a_mvt = st.slider("Left endpoint (a)", -2*math.pi, 2*math.pi, 0.0, 0.1, key="mvt_a_sin")
+            b_mvt = st.slider("Right endpoint (b)", -2*math.pi, 2*math.pi, math.pi, 0.1, key="mvt_b_sin")
+        else:  # ln(x+2)
+            a_mvt = st.slider("Left endpoint (a)", -1.5, 5.0, 0.0, 0.1, key="mvt_a_ln")
+            b_mvt = st.slider("Right endpoint (b)", -1.5, 5.0, 3.0, 0.1, key="mvt_b_ln")
+        
+        if a_mvt >= b_mvt:
+            st.error("⚠️ Please ensure a < b")
+        else:
+            show_tangent = st.checkbox("Show tangent line at c", True)
+            show_secant = st.checkbox("Show secant line", True)
+            show_calculation = st.checkbox("Show calculations", True)
+    
+    with col2:
+        if a_mvt < b_mvt:
+            # Calculate values and find c where f'(c) = average rate
+            mvt = engine.mvt_analysis(mvt_function, a_mvt, b_mvt)
+            
+            if show_calculation and mvt["c"] is None:
+                st.warning("No point c with f'(c) = average rate: f is not differentiable on all of (a, b).")
+            elif show_calculation:
+                c_list = ", ".join(f"{c:.3f}" for c in mvt["c_values"])
+                c_label = "MVT point: c" if len(mvt["c_values"]) == 1 else "MVT points: c"
+                st.markdown(f"""
+                <div class='concept-card'>
+                <h4>📊 Calculations</h4>
+                <p><strong>f(a) = f({a_mvt:.2f}) = {mvt["f_a"]:.3f}</strong></p>
+                <p><strong>f(b) = f({b_mvt:.2f}) = {mvt["f_b"]:.3f}</strong></p>
+                <p><strong>Average rate = (f(b)-f(a))/(b-a) = {mvt["avg_rate"]:.3f}</strong></p>
+                <p><strong>{c_label} = {c_list}</strong></p>
+                <p><strong>f'(c) = {mvt["f_prime_c"]:.3f}</strong></p>
+                <p style='color: green;'><strong>✓ f'(c) = average rate!</strong></p>
+                </div>
+                """, unsafe_allow_html=True)
+    
+    # Create the visualization
+    if a_mvt < b_mvt:
+        fig = cached_figure(("mvt", mvt_function, a_mvt, b_mvt, show_secant, show_tangent),
+                            lambda: figures.mvt_figure(mvt, a_mvt, b_mvt, show_secant, show_tangent))
+        st.plotly_chart(fig, use_container_width=True)
+
+
+def render():
+    st.header("📐 Mean Value Theorem Explorer")
+    
+    st.markdown("""
+    <div class='interactive-section'>
+    <h4>🎯 Understanding the Mean Value Theorem</h4>
+    <p>Explore how the instantaneous rate of change equals the average rate of change!</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # MVT Statement
+    st.markdown("""
+    <div class='formula-box'>
+    <h4>📜 Mean Value Theorem Statement</h4>
+    <p>If f(x) is <strong>continuous</strong> on [a,b] and <strong>differentiable</strong> on (a,b), then there exists at least one point c in (a,b) such that:</p>
+    <p style='text-align: center; font-size: 1.3em;'><strong>f'(c) = [f(b) - f(a)] / (b - a)</strong></p>
+    <p>In other words: <em>instantaneous rate of change = average rate of change</em></p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    _mvt_panel()
+    
+    # Conceptual explanation
+    st.markdown("""
+    <div class='concept-card'>
+    <h4>🧠 Why Does This Matter?</h4>
+    <p>The Mean Value Theorem guarantees that somewhere between any two points on a smooth curve, 
+    the instantaneous rate of change (derivative) equals the average rate of change (slope of secant line).</p>
+    
+    <h5>🚗 Real-World Example:</h5>
+    <p>If you drive 120 miles in 2 hours (average speed = 60 mph), then at some point during your trip, 
+    your speedometer read exactly 60 mph!</p>
+    
+    <h5>🔍 Key Insights:</h5>
+    <ul>
+    <li><strong>Geometric:</strong> The tangent line at c is parallel to the secant line</li>
+    <li><strong>Physical:</strong> Instantaneous velocity equals average velocity at some moment</li>
+    <li><strong>Mathematical:</strong> Connects local behavior (derivative) to global behavior (average rate)</li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Real-world applications of MVT
+    st.markdown("""
+    <div class='interactive-section'>
+    <h4>🌍 Real-World Applications of Mean Value Theorem</h4>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    mvt_col1, mvt_col2 = st.columns(2)
+    
+    with mvt_col1:
+        st.markdown("""
+        <div style='background: #e3f2fd; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #2196f3;'>
+        <h5>🚓 Traffic Law Enforcement</h5>
+        <p><strong>Speed Cameras:</strong> If cameras 10 miles apart record your car passing at specific times, police can prove you exceeded the speed limit somewhere between them using MVT!</p>
+        <p><strong>Example:</strong> Pass camera A at 2:00 PM, camera B at 2:06 PM → Average speed = 100 mph → You definitely hit 100 mph at some point!</p>
+        </div>
+        
+        <div style='background: #f3e5f5; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #9c27b0; margin-top: 1rem;'>
+        <h5>🏭 Manufacturing Quality Control</h5>
+        <p><strong>Temperature Monitoring:</strong> If a product's temperature changes from 70°F to 150°F over 10 minutes, MVT guarantees it hit every temperature in between at some point.</p>
+        <p><strong>Production Rates:</strong> Ensuring consistent manufacturing output by analyzing rate changes.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with mvt_col2:
+        st.markdown("""
+        <div style='background: #e8f5e8; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #4caf50;'>
+        <h5>🎯 Sports & Athletics</h5>
+        <p><strong>Running Analysis:</strong> If a marathon runner's average pace is 7 min/mile, MVT guarantees they ran exactly that pace at some point during the race.</p>
+        <p><strong>Baseball:</strong> A ball's velocity changes from 95 mph to 0 mph when caught → It had every intermediate velocity at some instant.</p>
+        </div>
+        
+        <div style='background: #fff3e0; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #ff9800; margin-top: 1rem;'>
+        <h5>💊 Medical Diagnostics</h5>
+        <p><strong>Blood Pressure:</strong> If systolic pressure changes from 120 to 140 mmHg during stress, it passed through every value in between.</p>
+        <p><strong>Drug Metabolism:</strong> Ensuring drug concentration levels behave predictably in the bloodstream.</p>
+        </div>
+        """, unsafe_allow_html=True)
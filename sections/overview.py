@@ -0,0 +1,34 @@
+"""Course overview and learning objectives."""
+import streamlit as st
+
+
+def render():
+    st.header("📖 Course Overview")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        <div class='concept-card'>
+        <h4>🎯 What You'll Learn</h4>
+        <ul>
+        <li><strong>Limits at Infinity:</strong> How functions behave as x approaches ±∞</li>
+        <li><strong>Horizontal Asymptotes:</strong> Lines that functions approach but never touch</li>
+        <li><strong>Interactive Visualization:</strong> See math concepts come alive</li>
+        <li><strong>Fundamental Theorem:</strong> The bridge between derivatives and integrals</li>
+        </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class='concept-card'>
+        <h4>🛠️ Interactive Tools</h4>
+        <ul>
+        <li><strong>Function Manipulatives:</strong> Drag sliders to change coefficients</li>
+        <li><strong>Real-time Graphing:</strong> See functions update instantly</li>
+        <li><strong>Step-by-step Solutions:</strong> Work through problems together</li>
+        <li><strong>Quiz Mode:</strong> Test your understanding</li>
+        </ul>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,198 @@
+"""Quiz Mode: multiple-choice review questions from the precomputed question bank."""
+import random
+import time
+import uuid
+
+import streamlit as st
+
+from mathcraft.answer_log import answer_log
+from mathcraft.leaderboard import leaderboard
+from mathcraft.quizbank import draw_quiz, get_question
+
+
+def _new_quiz():
+    if 'quiz_session' in st.session_state:
+        leaderboard.remove(st.session_state.quiz_session)
+    st.session_state.quiz_ids = draw_quiz(random.Random())
+    st.session_state.quiz_score = 0
+    st.session_state.quiz_question = 0
+    st.session_state.quiz_answered = -1
+
+
+# Seconds between leaderboard refreshes while this session's quiz is in progress
+LEADERBOARD_REFRESH = 15
+
+
+def _leaderboard():
+    """Top of the shared leaderboard and this session's rank."""
+    st.subheader("🏆 Class Leaderboard")
+    name_col, refresh_col = st.columns([3, 1], vertical_alignment="bottom")
+    name_col.text_input("Your leaderboard name:", key="quiz_name", max_chars=30)
+    refresh_col.button("🔄 Refresh", key="quiz_leaderboard_refresh")  # reruns just this fragment
+    leaders, own = leaderboard.top(10, st.session_state.quiz_session)
+    if not leaders:
+        st.caption("No scores yet. Submit an answer to join the board!")
+        return
+    st.dataframe([{
+        "Rank": row["rank"],
+        "Name": row["name"],
+        "Score": f"{row['score']}/{row['answered']}",
+    } for row in leaders], hide_index=True)
+    if own is not None:
+        st.caption(f"You are #{own['rank']} of {len(leaderboard.snapshot())} with {own['score']}/{own['answered']}.")
+
+
+def _leaderboard_panel(live):
+    """The leaderboard as a fragment: polled every ``LEADERBOARD_REFRESH`` s while ``live``, else on Refresh.
+
+    Only sessions in the middle of a quiz poll, so idle and finished ones
+    put no load on the server.
+    """
+    st.fragment(_leaderboard, run_every=LEADERBOARD_REFRESH if live else None)()
+
+
+def _analytics():
+    """Class-wide difficulty and time to answer per question family, from the answer log."""
+    rows = answer_log.question_stats(by="family")
+    if not rows:
+        st.info("No answers recorded yet.")
+        return
+    st.dataframe([{
+        "Question type": row["family"],
+        "Answers": row["answers"],
+        "% correct": f"{row['accuracy']:.0%}",
+        "Median time (s)": f"{row['median_seconds']:.1f}",
+        "90th percentile time (s)": f"{row['p90_seconds']:.1f}",
+    } for row in rows], hide_index=True)
+
+    bins = answer_log.time_distribution()
+    st.bar_chart({
+        "Time to answer": [f"{low}-{high} s" if high is not None else f"{low}+ s" for low, high, _ in bins],
+        "Answers": [count for _, _, count in bins],
+    }, x="Time to answer", y="Answers")
+
+
+def render():
+    st.header("🎮 Interactive Quiz Mode")
+    
+    st.markdown("""
+    <div class='interactive-section'>
+    <h4>🧠 Test Your Understanding!</h4>
+    <p>Practice problems with instant feedback and explanations.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Each session draws its own quiz; only the question ids are kept
+    if 'quiz_ids' not in st.session_state:
+        _new_quiz()
+    if 'quiz_session' not in st.session_state:
+        st.session_state.quiz_session = uuid.uuid4().hex
+        st.session_state.quiz_name = f"Student {st.session_state.quiz_session[:4]}"
+    questions = st.session_state.quiz_ids
+    
+    # Display current question
+    if st.session_state.quiz_question < len(questions):
+        question_id = questions[st.session_state.quiz_question]
+        current_q = get_question(question_id)
+        
+        # Time to answer runs from the first render of this question
+        shown = (st.session_state.quiz_question, question_id)
+        if st.session_state.get('quiz_shown') != shown:
+            st.session_state.quiz_shown = shown
+            st.session_state.quiz_shown_at = time.time()
+        
+        st.subheader(f"Question {st.session_state.quiz_question + 1} of {len(questions)}")
+        st.write(f"**Score: {st.session_state.quiz_score}/{st.session_state.quiz_question}**")
+        
+        st.markdown(f"""
+        <div class='concept-card'>
+        <h4>{current_q['question']}</h4>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Answer choices
+        user_answer = st.radio("Choose your answer:", current_q['options'], key=f"q_{st.session_state.quiz_question}_{question_id}")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            if st.button("Submit Answer"):
+                selected_index = current_q['options'].index(user_answer)
+                correct = selected_index == current_q['correct']
+                
+                # Only the first submission of a question is scored and logged
+                if st.session_state.quiz_answered != st.session_state.quiz_question:
+                    st.session_state.quiz_answered = st.session_state.quiz_question
+                    st.session_state.quiz_score += correct
+                    answer_log.record(question_id, selected_index, correct,
+                                      time.time() - st.session_state.quiz_shown_at,
+                                      session=st.session_state.quiz_session)
+                    leaderboard.update(st.session_state.quiz_session,
+                                       st.session_state.quiz_name.strip() or "Anonymous",
+                                       st.session_state.quiz_score, st.session_state.quiz_question + 1)
+                
+                if correct:
+                    st.success("✅ Correct!")
+                else:
+                    st.error(f"❌ Incorrect. The correct answer is: {current_q['options'][current_q['correct']]}")
+                
+                st.info(f"**Explanation:** {current_q['explanation']}")
+                
+        with col2:
+            if st.button("Next Question"):
+                st.session_state.quiz_question += 1
+                st.rerun()
+        
+        with col3:
+            if st.button("Reset Quiz"):
+                _new_quiz()
+                st.rerun()
+    
+    else:
+        # Quiz completed
+        percentage = (st.session_state.quiz_score / len(questions)) * 100
+        
+        st.markdown(f"""
+        <div class='interactive-section'>
+        <h2>🎉 Quiz Complete!</h2>
+        <h3>Final Score: {st.session_state.quiz_score}/{len(questions)} ({percentage:.1f}%)</h3>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if percentage >= 80:
+            st.balloons()
+            st.success("🌟 Excellent work! You've mastered these concepts!")
+        elif percentage >= 60:
+            st.info("👍 Good job! Review the topics you missed and try again.")
+        else:
+            st.warning("📚 Keep studying! Review the interactive sections and try the quiz again.")
+        
+        if st.button("Restart Quiz"):
+            _new_quiz()
+            st.rerun()
+    
+    # Study hints section
+    st.markdown("""
+    <div class='concept-card'>
+    <h4>💡 Study Hints</h4>
+    <ul>
+    <li><strong>Horizontal Asymptotes:</strong> Compare degrees of numerator and denominator</li>
+    <li><strong>Degree < Degree:</strong> Horizontal asymptote at y = 0</li>
+    <li><strong>Degree = Degree:</strong> Horizontal asymptote at y = (leading coefficients ratio)</li>
+    <li><strong>Degree > Degree:</strong> No horizontal asymptote</li>
+    <li><strong>FTC Part 1:</strong> d/dx[∫ₐˣ f(t) dt] = f(x)</li>
+    <li><strong>FTC Part 2:</strong> ∫ₐᵇ f(x) dx = F(b) - F(a) where F'(x) = f(x)</li>
+    <li><strong>Mean Value Theorem:</strong> f'(c) = [f(b) - f(a)]/(b - a) for some c in (a,b)</li>
+    <li><strong>MVT Requirements:</strong> Continuous on [a,b] and differentiable on (a,b)</li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # In progress: answered at least once and not finished
+    _leaderboard_panel(0 <= st.session_state.quiz_answered and st.session_state.quiz_question < len(questions))
+    
+    # Class analytics query the answer log only while the expander is open
+    expander = st.expander("📈 Class Analytics", key="quiz_analytics", on_change="rerun")
+    if expander.open:
+        with expander:
+            _analytics()
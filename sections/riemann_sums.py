@@ -0,0 +1,254 @@
+"""Riemann Sums manipulative: rectangle sums and their convergence."""
+import streamlit as st
+
+from mathcraft import engine, figures
+
+
+@st.fragment
+def _exploration_panel():
+    """Riemann sum inputs, visualization and convergence study; reruns on its own."""
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        riemann_func = st.selectbox("Choose function:", ["x**2", "sin(x)", "x**3 - 2*x", "1/x"])
+        a_bound = st.slider("Lower bound (a)", -5.0, 5.0, 0.0, 0.1, key="riemann_a")
+        b_bound = st.slider("Upper bound (b)", -5.0, 5.0, 2.0, 0.1, key="riemann_b")
+        n_rectangles = st.number_input("Number of rectangles", 1, 500_000, 10, step=10)
+    
+    with col2:
+        method = st.selectbox("Riemann sum method:", ["Left", "Right", "Midpoint"])
+        
+        if st.button("🎨 Create Visualization"):
+            try:
+                result = engine.riemann_sum(riemann_func, a_bound, b_bound, n_rectangles, method)
+                riemann_sum, dx = result["sum"], result["dx"]
+                
+                fig = figures.riemann_figure(result, riemann_func, method, n_rectangles)
+                st.plotly_chart(fig, use_container_width=True)
+                if result["group"] > 1:
+                    st.caption(f"Each bar shows the average of {result['group']} rectangles; the sum uses all {n_rectangles}.")
+                st.info(f"🧮 Riemann Sum Approximation: {riemann_sum:.6f}")
+                
+                # Add theoretical analysis
+                st.markdown(f"""
+                <div class='concept-card'>
+                <h4>📊 Analysis of Current Approximation</h4>
+                <p><strong>Function:</strong> f(x) = {riemann_func}</p>
+                <p><strong>Interval:</strong> [{a_bound:.2f}, {b_bound:.2f}]</p>
+                <p><strong>Method:</strong> {method} Riemann Sum</p>
+                <p><strong>Number of rectangles:</strong> {n_rectangles}</p>
+                <p><strong>Width of each rectangle (Δx):</strong> {dx:.4g}</p>
+                <p><strong>Approximation:</strong> {riemann_sum:.6f}</p>
+                
+                <h5>🎯 Improvement Suggestions:</h5>
+                <ul>
+                <li>Try increasing the number of rectangles to see convergence</li>
+                <li>Compare different methods (Left vs Right vs Midpoint)</li>
+                <li>Notice how the approximation changes with function curvature</li>
+                </ul>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                # Exact integral for comparison (where possible)
+                exact_integral = result["exact"]
+                if exact_integral is not None and exact_integral != 0:
+                    error = abs(riemann_sum - exact_integral)
+                    st.success(f"🎯 Exact integral: {exact_integral:.6f} | Error: {error:.6f} ({100*error/abs(exact_integral):.2f}%)")
+                
+            except Exception as e:
+                st.error(f"Error creating visualization: {str(e)}")
+        
+        if st.button("📉 Convergence Study"):
+            study = engine.riemann_convergence(riemann_func, a_bound, b_bound)
+            if study["errors"] is None:
+                st.warning(f"No finite exact value of ∫ {riemann_func} dx on [{a_bound:.2f}, {b_bound:.2f}] to measure the error against.")
+            else:
+                fig = figures.riemann_convergence_figure(study, riemann_func)
+                st.plotly_chart(fig, use_container_width=True)
+                orders = ", ".join(
+                    f"{method}: {order:.2f}" if order is not None else f"{method}: exact"
+                    for method, order in study["orders"].items()
+                )
+                st.info(f"📐 Observed convergence order (error ≈ C·n⁻ᵖ, n = 1 to {study['n'][-1]:,}): {orders}")
+
+
+def render():
+    st.subheader("Visualize Integration as Area Under Curve")
+    
+    # Theoretical Background Section
+    st.markdown("""
+    <div class='concept-card'>
+    <h4>📚 What are Riemann Sums?</h4>
+    <p><strong>Riemann sums</strong> are a method for approximating the area under a curve by dividing it into rectangles. 
+    They form the foundation of integral calculus and provide the rigorous definition of the definite integral.</p>
+    
+    <h5>🏗️ The Construction Process:</h5>
+    <ol>
+    <li><strong>Partition:</strong> Divide interval [a,b] into n subintervals of width Δx = (b-a)/n</li>
+    <li><strong>Choose points:</strong> Select a point in each subinterval to determine rectangle height</li>
+    <li><strong>Calculate areas:</strong> Sum up all rectangle areas: Σ f(xᵢ) · Δx</li>
+    <li><strong>Take the limit:</strong> As n → ∞, the sum approaches the exact integral</li>
+    </ol>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class='formula-box'>
+    <h4>📐 Mathematical Definition</h4>
+    <p>For a function f(x) on interval [a,b], the definite integral is defined as:</p>
+    <p style='text-align: center; font-size: 1.2em;'>
+    <strong>∫ₐᵇ f(x) dx = lim(n→∞) Σᵢ₌₁ⁿ f(xᵢ) · Δx</strong>
+    </p>
+    <p>where Δx = (b-a)/n and xᵢ is a point in the i-th subinterval.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Method comparison
+    col_theory1, col_theory2, col_theory3 = st.columns(3)
+    
+    with col_theory1:
+        st.markdown("""
+        <div style='background: #e3f2fd; padding: 1rem; border-radius: 8px; border-left: 4px solid #2196f3;'>
+        <h5>📍 Left Riemann Sum</h5>
+        <p><strong>xᵢ = a + (i-1)·Δx</strong></p>
+        <p>Uses left endpoint of each subinterval</p>
+        <p><em>Underestimates</em> if function is increasing</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col_theory2:
+        st.markdown("""
+        <div style='background: #f3e5f5; padding: 1rem; border-radius: 8px; border-left: 4px solid #9c27b0;'>
+        <h5>📍 Right Riemann Sum</h5>
+        <p><strong>xᵢ = a + i·Δx</strong></p>
+        <p>Uses right endpoint of each subinterval</p>
+        <p><em>Overestimates</em> if function is increasing</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col_theory3:
+        st.markdown("""
+        <div style='background: #e8f5e8; padding: 1rem; border-radius: 8px; border-left: 4px solid #4caf50;'>
+        <h5>📍 Midpoint Rule</h5>
+        <p><strong>xᵢ = a + (i-0.5)·Δx</strong></p>
+        <p>Uses midpoint of each subinterval</p>
+        <p><em>Generally more accurate</em> than left/right</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class='concept-card'>
+    <h4>🎯 Key Insights About Riemann Sums</h4>
+    
+    <h5>📈 Convergence Properties:</h5>
+    <ul>
+    <li><strong>More rectangles = Better approximation:</strong> As n increases, the approximation improves</li>
+    <li><strong>All methods converge:</strong> Left, right, and midpoint all approach the same limit</li>
+    <li><strong>Rate of convergence:</strong> Midpoint rule typically converges faster than left/right</li>
+    </ul>
+    
+    <h5>🔍 Error Analysis:</h5>
+    <ul>
+    <li><strong>Error ∝ 1/n:</strong> Doubling rectangles roughly halves the error</li>
+    <li><strong>Function behavior matters:</strong> Smooth functions have smaller errors</li>
+    <li><strong>Interval size matters:</strong> Larger intervals generally have larger errors</li>
+    </ul>
+    
+    <h5>🌉 Connection to FTC:</h5>
+    <p>Riemann sums provide the <em>definition</em> of the definite integral, while the Fundamental Theorem 
+    of Calculus gives us an <em>efficient method</em> to evaluate it using antiderivatives!</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    st.markdown("### 🎮 Interactive Exploration")
+    
+    _exploration_panel()
+    
+    # Historical context
+    st.markdown("""
+    <div class='concept-card'>
+    <h4>🏛️ Historical Context</h4>
+    <p><strong>Bernhard Riemann (1826-1866)</strong> was a German mathematician who formalized the concept 
+    of integration through his definition of Riemann sums. His work provided the rigorous foundation 
+    for integral calculus that we use today.</p>
+    
+    <h5>📜 Before Riemann:</h5>
+    <ul>
+    <li>Ancient Greeks used "method of exhaustion" for areas</li>
+    <li>Newton and Leibniz developed calculus but lacked rigorous definitions</li>
+    <li>Cauchy began formalizing limits and continuity</li>
+    </ul>
+    
+    <h5>🎓 Riemann's Contribution:</h5>
+    <ul>
+    <li>Precise definition of the definite integral</li>
+    <li>Conditions for integrability (Riemann integrable functions)</li>
+    <li>Foundation for modern real analysis</li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Real-world applications
+    st.markdown("""
+    <div class='interactive-section'>
+    <h4>🌍 Real-World Applications of Riemann Sums</h4>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    app_col1, app_col2 = st.columns(2)
+    
+    with app_col1:
+        st.markdown("""
+        <div style='background: #e8f5e8; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #4caf50;'>
+        <h5>✈️ Aerospace Engineering</h5>
+        <p><strong>Wing Design:</strong> Engineers use Riemann sums to calculate the total lift generated by airplane wings by integrating pressure distributions over the wing surface.</p>
+        <p><strong>Fuel Consumption:</strong> Airlines calculate total fuel usage by integrating fuel flow rate over time during flight.</p>
+        </div>
+        
+        <div style='background: #fff3e0; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #ff9800; margin-top: 1rem;'>
+        <h5>🏗️ Civil Engineering</h5>
+        <p><strong>Bridge Load Analysis:</strong> Calculating total stress on bridges by integrating distributed loads (traffic, wind, weight) across the span.</p>
+        <p><strong>Water Flow:</strong> Determining total water volume in irregularly shaped reservoirs or river channels.</p>
+        </div>
+        
+        <div style='background: #f3e5f5; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #9c27b0; margin-top: 1rem;'>
+        <h5>💊 Medical Applications</h5>
+        <p><strong>Drug Dosage:</strong> Calculating total drug absorption in the body by integrating concentration over time.</p>
+        <p><strong>Cardiac Output:</strong> Measuring heart function by integrating blood flow velocity over cross-sectional area.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with app_col2:
+        st.markdown("""
+        <div style='background: #e3f2fd; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #2196f3;'>
+        <h5>🚗 Automotive Industry</h5>
+        <p><strong>Distance Calculation:</strong> Your car's odometer uses integration - it continuously adds up tiny distance increments (speed × time) to show total distance traveled.</p>
+        <p><strong>Fuel Efficiency:</strong> EPA ratings are calculated by integrating instantaneous fuel consumption over standardized driving cycles.</p>
+        </div>
+        
+        <div style='background: #ffebee; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #f44336; margin-top: 1rem;'>
+        <h5>📊 Economics & Finance</h5>
+        <p><strong>Consumer Surplus:</strong> Economists integrate demand curves to calculate economic welfare and market efficiency.</p>
+        <p><strong>Present Value:</strong> Financial analysts integrate cash flows over time to determine investment values.</p>
+        </div>
+        
+        <div style='background: #e0f2f1; padding: 1.5rem; border-radius: 10px; border-left: 5px solid #009688; margin-top: 1rem;'>
+        <h5>🌿 Environmental Science</h5>
+        <p><strong>Pollution Levels:</strong> Calculating total emissions by integrating pollutant concentrations over time and area.</p>
+        <p><strong>Population Growth:</strong> Predicting animal population changes by integrating growth rates over time.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 1.5rem; border-radius: 10px; color: white; margin: 1rem 0;'>
+    <h5>🎯 Why This Matters to Students</h5>
+    <p><strong>Every time you:</strong></p>
+    <ul>
+    <li>🚗 Check your car's trip odometer → You're seeing Riemann sums in action!</li>
+    <li>💳 Calculate compound interest → You're using continuous integration</li>
+    <li>🏃‍♂️ Use a fitness tracker for calories burned → Integration of metabolic rate over time</li>
+    <li>🌡️ See weather "accumulation" reports → Integration of precipitation rate</li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
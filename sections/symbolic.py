@@ -0,0 +1,60 @@
+"""Helpers for manipulatives that run symbolic calls on the worker pool."""
+import warnings
+
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from mathcraft.workers import symbolic_pool
+
+try:
+    from streamlit.runtime.scriptrunner_utils.script_requests import (
+        RerunData, ScriptRequests, ScriptRequestType)
+except ImportError:  # moved in this Streamlit version; rerun_detection_works() reports it
+    ScriptRequests = None
+
+
+def _rerun_pending(requests):
+    """Whether Streamlit's ``ScriptRequests`` holds a rerun (or stop) for the running script.
+
+    There is no public API for this, so it reads the private request state;
+    ``rerun_detection_works`` checks that read against the installed Streamlit.
+    """
+    return requests._state is not ScriptRequestType.CONTINUE
+
+
+def rerun_detection_works():
+    """True if ``_rerun_pending`` tells an idle ``ScriptRequests`` from one with a rerun queued."""
+    if ScriptRequests is None:
+        return False
+    try:
+        requests = ScriptRequests()
+        idle = _rerun_pending(requests)
+        requests.request_rerun(RerunData())
+        return not idle and _rerun_pending(requests)
+    except Exception:
+        return False
+
+
+_DETECTS_RERUNS = rerun_detection_works()
+if not _DETECTS_RERUNS:
+    warnings.warn("Cannot detect pending reruns with this Streamlit version; symbolic calls "
+                  "will run to completion after their inputs change", RuntimeWarning)
+
+
+def input_changed():
+    """True once the user has changed a widget since this run started.
+
+    Streamlit queues the rerun and waits for the running script to yield,
+    so symbolic calls poll this to give up on a result nobody will see.
+    The new widget values only reach ``st.session_state`` when the rerun
+    starts, so the queued request is the only place to see them.
+    """
+    ctx = get_script_run_ctx()
+    return _DETECTS_RERUNS and ctx is not None and _rerun_pending(ctx.script_requests)
+
+
+def timeout_message(what):
+    """User-facing note for a symbolic call that ran past the pool's budget."""
+    stats = symbolic_pool.stats()
+    return (f"⏱️ {what} timed out after {stats['timeout']:g} s and was stopped. "
+            f"(Symbolic pool: {stats['busy']}/{stats['max_workers']} busy, "
+            f"{stats['queue_depth']} queued, {stats['timeouts']} timeouts so far)")